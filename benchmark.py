@@ -0,0 +1,273 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import chdir, redirect_stdout
+from io import StringIO
+
+import colour_tokens
+import role_catalogue
+from colour_tokens import build_textures
+from pack_writer import OutputWriter
+from text_metrics import count_lines
+from write_book import Script
+from write_model_selector import ROLE_ICONS_FILE, build_selector
+from write_models import build_models
+
+# The committed results for the default settings, recorded by the author on a single-CPU Linux x86-64
+# container with Python 3.11.7. It is only a local reference: the timings are absolute, so the comparison
+# fails on a slower machine.
+# Record a baseline of your own with --save-baseline before comparing, or pass --baseline to use another file.
+BASELINE_FILE = 'benchmark_baseline.json'
+
+# How often each team appears among the synthetic roles, roughly as in the official character list.
+TEAM_WEIGHTS = {'townsfolk': 13, 'outsider': 4, 'minion': 4, 'demon': 3, 'traveller': 2, 'fabled': 2}
+
+SYLLABLES = ['ka', 'vo', 'ru', 'mi', 'sel', 'dra', 'th', 'ow', 'en', 'gar', 'li', 'pu', 'ste', 'ny', 'bor', 'qu']
+WORDS = ('each night choose a player if they are the demon you learn this once per game at any time '
+         'you start knowing that your ability might not work the storyteller decides who dies tonight '
+         'whether or not it is evil good minion townsfolk outsider executed nominated vote '
+         'register as poisoned drunk until dusk two of the alive neighbours').split()
+
+
+def synthetic_text(rng, words):
+    """
+    Returns a sentence of random ability-like words.
+    """
+    return ' '.join(rng.choice(WORDS, words)).capitalize() + '.'
+
+
+def synthetic_roles(rng, count, ability_words, jinxes):
+    """
+    Returns a roles.json-style list of roles with random names, long ability text,
+    night order reminders and jinxes with other roles.
+    """
+    import numpy as np
+
+    teams = list(TEAM_WEIGHTS)
+    weights = np.array(list(TEAM_WEIGHTS.values())) / sum(TEAM_WEIGHTS.values())
+    roles, names = [], set()
+    for n in range(count):
+        name = ''.join(rng.choice(SYLLABLES, rng.integers(2, 5))).capitalize()
+        while name in names:
+            name += rng.choice(SYLLABLES)
+        names.add(name)
+        roles.append({
+            'id': f'role{n}',
+            'name': name,
+            'edition': 'benchmark',
+            'team': str(rng.choice(teams, p=weights)),
+            'firstNightReminder': synthetic_text(rng, ability_words // 2) if rng.random() < 0.5 else '',
+            'otherNightReminder': synthetic_text(rng, ability_words // 2) if rng.random() < 0.5 else '',
+            'reminders': [],
+            'setup': False,
+            'ability': synthetic_text(rng, ability_words),
+            'firstNight': int(rng.integers(1, 100)),
+            'otherNight': int(rng.integers(1, 100)),
+        })
+    for role in roles:
+        others = rng.choice(count, min(jinxes, count - 1), replace=False)
+        role['jinxes'] = [{'id': f'role{other}', 'reason': synthetic_text(rng, ability_words)}
+                          for other in others if f'role{other}' != role['id']]
+    return roles
+
+
+def synthetic_icon(rng, size):
+    """
+    Returns a random icon with a transparent rim, mostly opaque pixels and some partially transparent ones.
+    """
+    import numpy as np
+    from PIL import Image
+
+    icon = np.zeros((size, size, 4), np.uint8)
+    rim = size // 8
+    inner = size - 2 * rim
+    icon[rim:rim + inner, rim:rim + inner, :3] = rng.integers(0, 256, (inner, inner, 3))
+    icon[rim:rim + inner, rim:rim + inner, 3] = rng.choice([255, 255, 255, 128, 64], (inner, inner))
+    return Image.fromarray(icon, 'RGBA')
+
+
+def write_inputs(directory, icons, icon_size, roles, script_roles, ability_words, jinxes, seed):
+    """
+    Writes a synthetic set of icons, templates, roles, role icons and a script into a directory,
+    laid out as in the repository so that each stage can run on it unchanged.
+
+    :return: The path of the synthetic script.
+    """
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    os.makedirs(f'{directory}/icons')
+    for template in ('base.png', 'border.png'):
+        image = Image.open(template).convert('RGBA').resize((icon_size, icon_size), Image.NEAREST)
+        image.save(f'{directory}/{template}')
+    filenames = []
+    for n in range(icons):
+        filenames.append(f'icon{n}')
+        synthetic_icon(rng, icon_size).save(f'{directory}/icons/icon{n}.png')
+
+    role_list = synthetic_roles(rng, roles, ability_words, jinxes)
+    with open(f'{directory}/roles.json', 'w', encoding='utf8') as f:
+        json.dump(role_list, f)
+    with open(f'{directory}/{ROLE_ICONS_FILE}', 'w', encoding='utf8') as f:
+        json.dump({role['id']: filenames[n % len(filenames)] for n, role in enumerate(role_list)}, f)
+
+    script = f'{directory}/script.json'
+    with open(script, 'w', encoding='utf8') as f:
+        json.dump([{'id': '_meta', 'author': 'Benchmark', 'name': 'Benchmark'}]
+                  + [role['id'] for role in role_list[:script_roles]], f)
+    return script
+
+
+def stages(script, workers):
+    """
+    Returns each stage of the build to time, in order, as a name and a function that runs it once.
+    """
+    writer = OutputWriter()
+    books = []
+
+    def write_script():
+        book = Script(script)
+        book.write_script()
+        books[:] = [book]
+
+    return [
+        ('textures', lambda: build_textures(workers, force=True, writer=writer)),
+        ('models', lambda: build_models(force=True, writer=writer)),
+        ('selector', lambda: build_selector(force=True, writer=writer, source='json')),
+        ('write_script', write_script),
+        ('save', lambda: books[-1].save(writer=writer)),
+    ]
+
+
+def reset_memos():
+    """
+    Forgets what this process has memoised between runs, so that every run pays for its own text measurement,
+    role catalogue load, template decoding and gradient lookup tables, as a fresh build process would.
+    """
+    count_lines.cache_clear()
+    role_catalogue._catalogues.clear()
+    colour_tokens.TEMPLATES.clear()
+    colour_tokens.LOOKUP_TABLES.clear()
+
+
+def measure(function, repeat):
+    """
+    Runs a stage repeatedly from cold and returns its fastest time in seconds and, from one further traced run,
+    the peak memory it allocated in this process in bytes. Output from the stage is discarded.
+    """
+    times = []
+    with redirect_stdout(StringIO()):
+        for _ in range(repeat):
+            reset_memos()
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        reset_memos()
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return min(times), peak
+
+
+def run(config):
+    """
+    Generates the synthetic inputs for a configuration in a temporary directory and measures every stage on them.
+
+    :return: A dictionary of stage names to their 'seconds' and 'peak_bytes'.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        script = write_inputs(directory, config['icons'], config['icon_size'], config['roles'],
+                              config['script_roles'], config['ability_words'], config['jinxes'], config['seed'])
+        with chdir(directory):
+            for name, function in stages(script, config['workers']):
+                seconds, peak = measure(function, config['repeat'])
+                results[name] = {'seconds': seconds, 'peak_bytes': peak}
+                print(f'{name:>14}: {seconds * 1000:9.1f} ms  {peak / 1024:9.0f} KiB')
+    return results
+
+
+def compare(results, baseline, threshold, min_seconds):
+    """
+    Compares the results against a baseline, printing the change in each stage.
+
+    :param threshold: The fraction that a stage's time or peak memory may grow by before it counts as a regression.
+    :param min_seconds: Time differences smaller than this are treated as noise.
+    :return: A description of each regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f'{name:>14}: not in the baseline')
+            continue
+        base = baseline[name]
+        time_change = result['seconds'] / base['seconds'] - 1 if base['seconds'] else 0
+        memory_change = result['peak_bytes'] / base['peak_bytes'] - 1 if base['peak_bytes'] else 0
+        print(f'{name:>14}: {time_change:+8.1%} time  {memory_change:+8.1%} memory')
+        if time_change > threshold and result['seconds'] - base['seconds'] > min_seconds:
+            regressions.append(f'{name} took {result["seconds"] * 1000:.1f} ms, {time_change:+.1%} on the baseline')
+        if memory_change > threshold:
+            regressions.append(f'{name} peaked at {result["peak_bytes"] / 1024:.0f} KiB, '
+                               f'{memory_change:+.1%} on the baseline')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark each stage of the build on synthetic inputs.')
+    parser.add_argument('-n', '--icons', type=int, default=40,
+                        help='number of synthetic icons (default: 40)')
+    parser.add_argument('--icon-size', type=int, default=16,
+                        help='width and height of each icon in pixels (default: 16)')
+    parser.add_argument('--roles', type=int, default=200,
+                        help='number of synthetic roles in roles.json (default: 200)')
+    parser.add_argument('-m', '--script-roles', type=int, default=60,
+                        help='number of roles in the synthetic script (default: 60)')
+    parser.add_argument('--ability-words', type=int, default=40,
+                        help='words in each ability and jinx reason (default: 40)')
+    parser.add_argument('--jinxes', type=int, default=3,
+                        help='jinxes listed by each role (default: 3)')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed for the synthetic inputs (default: 0)')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='worker processes for the texture stage; memory is only traced in this process '
+                             '(default: 1)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='timed runs of each stage, of which the fastest is kept (default: 3)')
+    parser.add_argument('-b', '--baseline', default=BASELINE_FILE,
+                        help=f'the baseline results to compare against (default: {BASELINE_FILE})')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='save the results as the new baseline instead of comparing against it')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help='fractional growth in time or memory that fails the comparison (default: 0.2)')
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help='ignore time differences smaller than this (default: 0.005)')
+    args = parser.parse_args()
+
+    config = {key: getattr(args, key) for key in
+              ('icons', 'icon_size', 'roles', 'script_roles', 'ability_words', 'jinxes', 'seed', 'workers', 'repeat')}
+    results = run(config)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf8') as f:
+            json.dump({'config': config, 'stages': results}, f, indent=2)
+        print(f'Saved the baseline to {args.baseline}')
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf8') as f:
+            baseline = json.load(f)
+        if baseline['config'] != config:
+            sys.exit(f'{args.baseline} was recorded with different settings: {baseline["config"]}')
+        regressions = compare(results, baseline['stages'], args.threshold, args.min_seconds)
+        for regression in regressions:
+            print(f'regression: {regression}')
+        if regressions:
+            sys.exit(1)
+    else:
+        print(f'No baseline at {args.baseline}; run with --save-baseline to record one')
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+
+MANIFEST_DIR = 'generated/.manifest'
+
+
+def hash_bytes(data):
+    """
+    Returns the hex SHA-256 digest of some bytes.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """
+    Returns the hex SHA-256 digest of a file's contents, or None if the file does not exist.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return hash_bytes(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def hash_data(data):
+    """
+    Returns the hex SHA-256 digest of a JSON-serialisable value, independent of key order.
+    """
+    return hash_bytes(json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf8'))
+
+
+class BuildManifest:
+    """
+    Records the content hashes of the inputs and outputs of each generated artefact,
+    so that reruns only regenerate artefacts whose inputs have changed.
+
+    Each generator keeps its own manifest, keyed by an artefact name of its choosing
+    (for example, the icon filename). A disabled manifest treats everything as stale and
+    never prunes or saves, for output that is not written as loose files.
+    """
+
+    def __init__(self, name, force=False, enabled=True):
+        self.path = f'{MANIFEST_DIR}/{name}.json'
+        self.force = force or not enabled
+        self.enabled = enabled
+        self.entries = {}
+        self.seen = set()
+        if enabled and os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf8') as f:
+                self.entries = json.load(f)
+
+    def is_fresh(self, key, inputs):
+        """
+        Returns whether an artefact was built from the same inputs and its outputs are untouched.
+
+        :param key: The artefact name.
+        :param inputs: A dictionary of input names to content hashes.
+        """
+        self.seen.add(key)
+        if self.force:
+            return False
+        entry = self.entries.get(key)
+        if entry is None or entry['inputs'] != inputs:
+            return False
+        return all(hash_file(path) == digest for path, digest in entry['outputs'].items())
+
+    def record(self, key, inputs, outputs):
+        """
+        Records the inputs and freshly written outputs of an artefact.
+
+        :param key: The artefact name.
+        :param inputs: A dictionary of input names to content hashes.
+        :param outputs: The paths of the files written for this artefact.
+        """
+        self.seen.add(key)
+        if not self.enabled:
+            return
+        self.entries[key] = {'inputs': inputs, 'outputs': {path: hash_file(path) for path in sorted(outputs)}}
+
+    def prune(self, directories=None):
+        """
+        Deletes the outputs of artefacts that were not checked or recorded during this run.
+
+        :param directories: If given, only artefacts whose keys are paths directly inside one of these
+            directories are pruned, for runs that only build some of the artefacts.
+        :return: The paths of the deleted files.
+        """
+        if not self.enabled:
+            return []
+        live = {path for key in self.seen if key in self.entries for path in self.entries[key]['outputs']}
+        unseen = set(self.entries) - self.seen
+        if directories is not None:
+            directories = {os.path.normpath(directory) for directory in directories}
+            unseen = {key for key in unseen if os.path.normpath(os.path.dirname(key)) in directories}
+        removed = []
+        for key in sorted(unseen):
+            for path in self.entries.pop(key)['outputs']:
+                if path not in live and os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+        return removed
+
+    def save(self):
+        """
+        Writes the manifest to disk.
+        """
+        if not self.enabled:
+            return
+        os.makedirs(MANIFEST_DIR, exist_ok=True)
+        with open(self.path, 'w', encoding='utf8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
@@ -0,0 +1,58 @@
+import argparse
+
+import tracing
+from colour_tokens import build_atlas, build_textures
+from optimise_textures import optimise_pack, report
+from pack_writer import PackWriter
+from resource_generator import build_resources
+from write_model_selector import build_selector
+from write_models import build_models
+
+
+def build_pack(target, workers=None, atlas=False, source='xlsx', optimise=True):
+    """
+    Builds the whole resource pack in one pass, writing the textures, models, paper selector
+    and custom-named prop items straight into a resource pack directory or .zip file.
+
+    :param target: The resource pack to write, as a directory or a path ending in '.zip'.
+    :param workers: The number of worker processes to recolour textures with.
+    :param atlas: Whether to pack the textures into atlas sheets.
+    :param source: Where the paper selector reads its roles from, 'xlsx' or 'json'.
+    :param optimise: Whether to deduplicate and recompress the textures before the pack is written.
+    """
+    with PackWriter(target) as pack:
+        if atlas:
+            with tracing.span('atlas'):
+                build_atlas(workers, writer=pack)
+        else:
+            with tracing.span('textures'):
+                build_textures(workers, writer=pack)
+            with tracing.span('models'):
+                build_models(writer=pack)
+        with tracing.span('selector'):
+            build_selector(writer=pack, source=source)
+        with tracing.span('resources'):
+            build_resources(writer=pack)
+        if optimise:
+            with tracing.span('optimise textures'):
+                report(*optimise_pack(pack))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the token resource pack.')
+    parser.add_argument('target', nargs='?', default='botctokens.zip',
+                        help='the resource pack directory or .zip file to write (default: botctokens.zip)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('--atlas', action='store_true',
+                        help='pack the textures into atlas sheets rather than writing one file per texture')
+    parser.add_argument('--source', choices=('xlsx', 'json'), default='xlsx',
+                        help='build the paper selector from roles.xlsx, or from every role in roles.json '
+                             '(default: xlsx)')
+    parser.add_argument('--no-optimise', dest='optimise', action='store_false',
+                        help='store the textures as they are generated, without deduplicating or recompressing them')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record where the build spends its time to a Chrome trace event JSON file')
+    args = parser.parse_args()
+    with tracing.trace(args.trace):
+        build_pack(args.target, args.workers, args.atlas, args.source, args.optimise)
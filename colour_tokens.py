@@ -1,111 +1,340 @@
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
 
-from PIL import Image
-from colorsys import rgb_to_hsv, hsv_to_rgb
+from build_cache import BuildManifest, hash_data, hash_file
+from main import GRADIENTS, PALETTE_VALUE_RANGE, PALETTES
+import tracing
+from pack_writer import OutputWriter, PackWriter
 
-def rgb2hsv(r, g, b):
+# The width and height of each atlas sheet, in pixels.
+ATLAS_SIZE = 256
+
+# The display transforms of minecraft:item/generated, for atlas models that cannot inherit from it.
+ATLAS_MODEL_DISPLAY = {
+    "ground": {"rotation": [0, 0, 0], "translation": [0, 2, 0], "scale": [0.5, 0.5, 0.5]},
+    "head": {"rotation": [0, 180, 0], "translation": [0, 13, 7], "scale": [1, 1, 1]},
+    "thirdperson_righthand": {"rotation": [0, 0, 0], "translation": [0, 3, 1], "scale": [0.55, 0.55, 0.55]},
+    "firstperson_righthand": {"rotation": [0, -90, 25], "translation": [1.13, 3.2, 1.13], "scale": [0.68, 0.68, 0.68]},
+    "fixed": {"rotation": [0, 180, 0], "scale": [1, 1, 1]},
+}
+
+TEMPLATES = {}
+# The lookup table of each gradient, built on first use by lookup_tables.
+LOOKUP_TABLES = {}
+
+
+def map_colours(v, v1, v2, c1, c2):
     """
-    Converts from RGB255 to unit HSV.
+    Maps an array of values from one range onto a gradient between two colours.
     """
-    return rgb_to_hsv(r/255, g/255, b/255)
+    import numpy as np
 
-def hsv2rgb(h, s, v):
+    p = (v - v1) / (v2 - v1)
+    return lerp_colours(np.array(c1), np.array(c2), p[..., None])
+
+
+def lerp_colours(c1, c2, p):
     """
-    Converts from unit HSV to RGB255.
+    Linearly interpolates between two colour arrays, rounding to whole channel values.
     """
-    return [round(i*255) for i in hsv_to_rgb(h, s, v)]
+    return (c1 + p * (c2 - c1)).round()
 
-def map_colours(v, v1, v2, c1, c2):
+
+def build_lookup_tables():
     """
-    Maps a value from one range to another.
+    Precomputes the RGBA colour of every gradient for each of the 256 possible icon values.
     """
-    p = (v - v1) / (v2 - v1)
-    return lerp_tuple(c1, c2, p)
-
-def lerp_tuple(c1, c2, p):
-    return tuple(round(c1[i] + p * (c2[i] - c1[i])) for i in range(len(c1)))
-
-bord = Image.open('border.png').convert('RGBA')
-border = bord.load()
-
-for filename in os.listdir('icons'):
-    if not filename.endswith('.png'):
-        continue
-    print(filename)
-
-    img = Image.open(f'icons/{filename}').convert('RGBA')
-    width, height = img.size
-    image = img.load()
-
-    tf = Image.open(f'base.png').convert('RGBA')
-    townsfolk = tf.load()
-
-    ou = Image.open(f'base.png').convert('RGBA')
-    outsider = ou.load()
-
-    mi = Image.open(f'base.png').convert('RGBA')
-    minion = mi.load()
-
-    de = Image.open(f'base.png').convert('RGBA')
-    demon = de.load()
-
-    fa = Image.open(f'base.png').convert('RGBA')
-    fabled = fa.load()
-
-    tr = Image.open(f'base.png').convert('RGBA')
-    traveller = tr.load()
-    good_tr = Image.open(f'base.png').convert('RGBA')
-    good_traveller = good_tr.load()
-    evil_tr = Image.open(f'base.png').convert('RGBA')
-    evil_traveller = evil_tr.load()
-
-    minv = 1
-    maxv = 0
-    for x in range(width):
-        for y in range(height):
-            r, g, b, a = image[x, y]
-            if a == 0:
-                continue
-            if border[x, y][3] == 255:
-                continue
-
-            h,s,v = rgb2hsv(r, g, b)
-            minv = min(v, minv)
-            maxv = max(v, maxv)
-            townsfolk_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (0, 89, 183), (0, 138, 212))
-            outsider_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (0, 149, 183), (0, 208, 212))
-            minion_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (147, 15, 19), (196, 47, 49))
-            demon_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (114, 11, 14), (161, 17, 22))
-            fabled_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (166, 84, 0), (219, 186, 0))
-            if a == 255:
-                townsfolk[x, y] = (*townsfolk_colour, 255)
-                outsider[x, y] = (*outsider_colour, 255)
-                minion[x, y] = (*minion_colour, 255)
-                demon[x, y] = (*demon_colour, 255)
-                fabled[x, y] = (*fabled_colour, 255)
-                if x < width // 2:
-                    traveller[x, y] = (*townsfolk_colour, 255)
-                    good_traveller[x, y] = (*townsfolk_colour, 255)
-                    evil_traveller[x, y] = (*fabled_colour, 255)
-                else:
-                    traveller[x, y] = (*minion_colour, 255)
-                    good_traveller[x, y] = (*fabled_colour, 255)
-                    evil_traveller[x, y] = (*minion_colour, 255)
-            else:
-                townsfolk[x, y] = lerp_tuple(townsfolk[x, y], (*townsfolk_colour, 255), a/400)
-                outsider[x, y] = lerp_tuple(outsider[x, y], (*outsider_colour, 255), a/300)
-                minion[x, y] = lerp_tuple(minion[x, y], (*minion_colour, 255), a/300)
-                demon[x, y] = lerp_tuple(demon[x, y], (*demon_colour, 255), a/400)
-                traveller[x, y] = lerp_tuple(traveller[x, y], (*fabled_colour, 255), a/400)
-
-
-    # tf.save(f'textures/good/{filename}')
-    # mi.save(f'textures/evil/{filename}')
-    tf.save(f'generated/textures/item/townsfolk/{filename}')
-    ou.save(f'generated/textures/item/outsider/{filename}')
-    mi.save(f'generated/textures/item/minion/{filename}')
-    de.save(f'generated/textures/item/demon/{filename}')
-    fa.save(f'generated/textures/item/fabled/{filename}')
-    tr.save(f'generated/textures/item/traveller/{filename}')
-    good_tr.save(f'generated/textures/item/good_traveller/{filename}')
-    evil_tr.save(f'generated/textures/item/evil_traveller/{filename}')
+    import numpy as np
+
+    v = np.arange(256) / 255
+    tables = {}
+    for name, (c1, c2) in GRADIENTS.items():
+        colours = map_colours(v, *PALETTE_VALUE_RANGE, c1, c2)
+        tables[name] = np.concatenate([colours, np.full((256, 1), 255.0)], axis=-1)
+    return tables
+
+
+def lookup_tables():
+    """
+    Returns the gradient lookup tables, building them the first time they are needed in this process.
+    """
+    if not LOOKUP_TABLES:
+        LOOKUP_TABLES.update(build_lookup_tables())
+    return LOOKUP_TABLES
+
+
+def to_image(pixels):
+    """
+    Converts a float RGBA pixel array back into an 8-bit PIL image.
+    """
+    import numpy as np
+    from PIL import Image
+
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), 'RGBA')
+
+
+def recolour(icon, border, base):
+    """
+    Recolours an icon onto the token base for every palette.
+
+    :param icon: The icon pixels as an (height, width, 4) uint8 array.
+    :param border: The border pixels, used to mask out the token rim.
+    :param base: The blank token pixels that the icon is drawn onto.
+    :return: A dictionary of palette names to recoloured float RGBA arrays.
+    """
+    import numpy as np
+
+    tables = lookup_tables()
+    alpha = icon[..., 3]
+    mask = (alpha != 0) & (border[..., 3] != 255)
+    opaque = mask & (alpha == 255)
+    blended = mask & (alpha != 255)
+
+    # The HSV value of each pixel is its largest channel, so it indexes straight into the lookup tables.
+    value = icon[..., :3].max(axis=-1)
+    opaque_values = value[opaque]
+    blended_values = value[blended]
+    opaque_left = np.nonzero(opaque)[1] < icon.shape[1] // 2
+    blended_alpha = alpha[blended].astype(np.float64)[:, None]
+    blended_base = base[blended].astype(np.float64)
+
+    textures = {}
+    for name, palette in PALETTES.items():
+        texture = base.astype(np.float64)
+        gradient = palette['gradient']
+        if isinstance(gradient, str):
+            texture[opaque] = tables[gradient][opaque_values]
+        else:
+            left, right = gradient
+            texture[opaque] = np.where(opaque_left[:, None], tables[left][opaque_values], tables[right][opaque_values])
+        if palette['blend']:
+            gradient, divisor = palette['blend']
+            texture[blended] = lerp_colours(blended_base, tables[gradient][blended_values], blended_alpha / divisor)
+        textures[name] = texture
+    return textures
+
+
+def load_templates():
+    """
+    Decodes the shared border and base token images.
+    """
+    import numpy as np
+    from PIL import Image
+
+    return {
+        'border': np.asarray(Image.open('border.png').convert('RGBA')),
+        'base': np.asarray(Image.open('base.png').convert('RGBA')),
+    }
+
+
+def init_worker(trace=False):
+    """
+    Decodes the templates once per worker process, rather than once per icon.
+    """
+    tracing.init(trace)
+    with tracing.span('load templates'):
+        TEMPLATES.update(load_templates())
+
+
+def recolour_icon(filename):
+    """
+    Recolours a single icon for every palette without saving it.
+
+    :return: The icon filename and a dictionary of palette names to PIL images.
+    """
+    import numpy as np
+    from PIL import Image
+
+    with tracing.span('decode', icon=filename):
+        icon = np.asarray(Image.open(f'icons/{filename}').convert('RGBA'))
+    with tracing.span('recolour', icon=filename):
+        return filename, {name: to_image(texture)
+                          for name, texture in recolour(icon, TEMPLATES['border'], TEMPLATES['base']).items()}
+
+
+def colour_icon(filename):
+    """
+    Recolours a single icon for every palette and encodes each texture as a PNG.
+
+    :return: The icon filename and a dictionary of palette names to PNG bytes.
+    """
+    textures = {}
+    images = recolour_icon(filename)[1]
+    with tracing.span('encode', icon=filename):
+        for name, image in images.items():
+            buffer = BytesIO()
+            image.save(buffer, 'PNG')
+            textures[name] = buffer.getvalue()
+    return filename, textures
+
+
+def map_icons(function, filenames, workers=None):
+    """
+    Maps a function over icon filenames, in a pool of worker processes unless workers is 1.
+    Results are returned in the same order as the filenames, and the workers' trace events are collected.
+    """
+    if not filenames:
+        return []
+    if workers == 1:
+        # Templates stay decoded between calls in this process, until TEMPLATES is cleared.
+        if not TEMPLATES:
+            with tracing.span('load templates'):
+                TEMPLATES.update(load_templates())
+        return list(map(function, filenames))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tracing.enabled(),)) as pool:
+        results = []
+        for result, events in pool.map(partial(tracing.call, function), filenames):
+            results.append(result)
+            tracing.add_events(events)
+        return results
+
+
+def template_inputs():
+    """
+    Returns the content hashes of the inputs shared by every icon.
+    """
+    return {
+        'base': hash_file('base.png'),
+        'border': hash_file('border.png'),
+        'palettes': hash_data([PALETTE_VALUE_RANGE, GRADIENTS, PALETTES]),
+        'engine': hash_file(__file__),
+    }
+
+
+def build_textures(workers=None, force=False, writer=None):
+    """
+    Recolours every icon in the icons directory, spread across a pool of worker processes.
+    Icons whose inputs are unchanged since the last build are skipped, and the textures
+    of icons that no longer exist are deleted.
+
+    :param workers: The number of worker processes to use. Defaults to the number of CPUs,
+        and 1 recolours everything in the current process.
+    :param force: Whether to rebuild every icon, even if it is up to date.
+    :param writer: The output to write the textures to. Defaults to loose files under generated.
+    """
+    writer = writer or OutputWriter()
+    filenames = sorted(f for f in os.listdir('icons') if f.endswith('.png'))
+    shared_inputs = template_inputs()
+    inputs = {f: {**shared_inputs, 'icon': hash_file(f'icons/{f}')} for f in filenames}
+    manifest = BuildManifest('textures', force, writer.incremental)
+    stale = [f for f in filenames if not manifest.is_fresh(f, inputs[f])]
+
+    tracing.counter('icons', stale=len(stale), fresh=len(filenames) - len(stale))
+    with tracing.span('recolour icons', icons=len(stale), workers=workers):
+        results = map_icons(colour_icon, stale, workers)
+    for filename, textures in results:
+        print(filename)
+        with tracing.span('write textures', icon=filename):
+            outputs = [writer.write_bytes(f'textures/item/{name}/{filename}', png) for name, png in textures.items()]
+        manifest.record(filename, inputs[filename], outputs)
+    for path in manifest.prune():
+        print(f'Removed {path}')
+    manifest.save()
+    print(f'{len(results)} rebuilt, {len(filenames) - len(results)} up to date')
+
+
+def atlas_model(texture, x, y, width, height, atlas_size=ATLAS_SIZE):
+    """
+    Returns an item model that draws one rectangle of an atlas sheet as a flat, two-sided quad.
+
+    :param texture: The resource location of the atlas sheet.
+    :param x: The left edge of the rectangle in pixels.
+    :param y: The top edge of the rectangle in pixels.
+    :param width: The width of the rectangle in pixels.
+    :param height: The height of the rectangle in pixels.
+    :param atlas_size: The width and height of the atlas sheet in pixels.
+    """
+    # Model UVs are measured in sixteenths of the texture, whatever its size.
+    u1, v1 = x * 16 / atlas_size, y * 16 / atlas_size
+    u2, v2 = (x + width) * 16 / atlas_size, (y + height) * 16 / atlas_size
+    return {
+        "textures": {"atlas": texture, "particle": texture},
+        "elements": [{
+            "from": [0, 0, 7.5],
+            "to": [16, 16, 8.5],
+            "faces": {
+                "north": {"uv": [u2, v1, u1, v2], "texture": "#atlas"},
+                "south": {"uv": [u1, v1, u2, v2], "texture": "#atlas"},
+            }
+        }],
+        "gui_light": "front",
+        "display": ATLAS_MODEL_DISPLAY,
+    }
+
+
+def build_atlas(workers=None, force=False, writer=None):
+    """
+    Recolours every icon in the icons directory and packs every variant into a few square atlas sheets,
+    instead of one texture file per icon and palette. Writes the sheets, an index mapping each
+    palette/icon pair to its sheet and rectangle, and a model per pair that references its rectangle.
+
+    :param workers: The number of worker processes to use. Defaults to the number of CPUs,
+        and 1 recolours everything in the current process.
+    :param force: Whether to rebuild the atlas, even if it is up to date.
+    :param writer: The output to write the atlas to. Defaults to loose files under generated.
+    """
+    from PIL import Image
+
+    writer = writer or OutputWriter()
+    filenames = sorted(f for f in os.listdir('icons') if f.endswith('.png'))
+    inputs = {**template_inputs(), 'icons': {f: hash_file(f'icons/{f}') for f in filenames}}
+    manifest = BuildManifest('atlas', force, writer.incremental)
+    if manifest.is_fresh('atlas', inputs):
+        print('Atlas is up to date')
+        return
+
+    with tracing.span('recolour icons', icons=len(filenames), workers=workers):
+        textures = dict(map_icons(recolour_icon, filenames, workers))
+    tile_height, tile_width = load_templates()['base'].shape[:2]
+    columns = ATLAS_SIZE // tile_width
+    tiles_per_sheet = columns * (ATLAS_SIZE // tile_height)
+
+    sheets = []
+    index = {}
+    outputs = []
+    tiles = [(name, filename) for name in PALETTES for filename in filenames]
+    for n, (name, filename) in enumerate(tiles):
+        sheet, position = divmod(n, tiles_per_sheet)
+        if sheet == len(sheets):
+            sheets.append(Image.new('RGBA', (ATLAS_SIZE, ATLAS_SIZE)))
+        x, y = position % columns * tile_width, position // columns * tile_height
+        sheets[sheet].paste(textures[filename][name], (x, y))
+
+        icon = filename.removesuffix('.png')
+        texture = f'botctokens:item/atlas/{sheet}'
+        index[f'{name}/{icon}'] = {'sheet': texture, 'x': x, 'y': y, 'width': tile_width, 'height': tile_height}
+        outputs.append(writer.write_json(f'models/{name}/{icon}.json',
+                                         atlas_model(texture, x, y, tile_width, tile_height)))
+
+    for n, sheet in enumerate(sheets):
+        with tracing.span('encode', sheet=n):
+            outputs.append(writer.write_image(f'textures/item/atlas/{n}.png', sheet))
+    outputs.append(writer.write_json('atlas.json', {'size': ATLAS_SIZE, 'textures': index}, indent=2))
+
+    manifest.record('atlas', inputs, outputs)
+    manifest.prune()
+    manifest.save()
+    print(f'Packed {len(tiles)} textures into {len(sheets)} atlas sheets')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Recolour the token icons for every alignment.')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='rebuild every texture, even if it is up to date')
+    parser.add_argument('--atlas', action='store_true',
+                        help='pack the textures into atlas sheets rather than writing one file per texture')
+    parser.add_argument('--pack', metavar='PATH',
+                        help='write into a resource pack directory, or a .zip file, instead of generated')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record where the build spends its time to a Chrome trace event JSON file')
+    args = parser.parse_args()
+    with tracing.trace(args.trace), PackWriter(args.pack) if args.pack else OutputWriter() as writer:
+        if args.atlas:
+            build_atlas(args.workers, args.force, writer)
+        else:
+            build_textures(args.workers, args.force, writer)
@@ -0,0 +1,233 @@
+import argparse
+import json
+import re
+
+from pack_writer import OutputWriter
+from role_catalogue import load_catalogue
+from text_metrics import COLOUR_CODES, FORMAT_CODE
+from write_book import COLOURS, MAX_BOOK_PAGES, MAX_PAGE_LENGTH, Script, book_jobs
+
+# The most characters a command block runs, which also keeps function lines a manageable size.
+MAX_COMMAND_LENGTH = 32500
+MAX_TITLE_LENGTH = 32
+
+# The text component fields set by each formatting code, in the order they are written.
+FORMAT_FIELDS = {'l': 'bold', 'o': 'italic', 'n': 'underlined', 'm': 'strikethrough', 'k': 'obfuscated'}
+COLOUR_NAMES = {code: name for name, code in COLOURS.items() if code in COLOUR_CODES}
+FORMAT_CODES = {field: code for code, field in FORMAT_FIELDS.items()}
+DEFAULT_STYLE = (None, frozenset())
+# Book text is black unless it is styled otherwise, so black is the same as no colour.
+DEFAULT_COLOUR = 'black'
+
+
+def parse_runs(text):
+    """
+    Splits text with § formatting codes into runs of text in a single style, merging adjacent runs
+    with the same style. As in Minecraft, a colour code or §r clears the formatting before it, so
+    the resets that formatted_text ends each piece with disappear unless the style really changes.
+    Runs of only newlines take the style of the run before them, since a newline shows no style.
+
+    :return: A list of (style, text) runs, where a style is a (colour name or None, set of format fields) pair.
+    """
+    runs = []
+    colour, formats = DEFAULT_STYLE
+    chars = iter(text)
+    for char in chars:
+        if char == FORMAT_CODE:
+            code = next(chars, '').lower()
+            if code in COLOUR_NAMES:
+                colour = COLOUR_NAMES[code] if COLOUR_NAMES[code] != DEFAULT_COLOUR else None
+                formats = frozenset()
+            elif code == 'r':
+                colour, formats = DEFAULT_STYLE
+            elif code in FORMAT_FIELDS:
+                formats = formats | {FORMAT_FIELDS[code]}
+            continue
+        style = (colour, formats)
+        if runs and runs[-1][0] == style:
+            runs[-1][1] += char
+        else:
+            runs.append([style, char])
+    return merge_newlines(runs)
+
+
+def merge_newlines(runs):
+    """
+    Folds runs that only hold newlines into the run before them, then merges runs left with the same style.
+    """
+    merged = []
+    for style, text in runs:
+        if merged and (text.strip('\n') == '' or merged[-1][0] == style):
+            merged[-1][1] += text
+        else:
+            merged.append([style, text])
+    return [(style, text) for style, text in merged]
+
+
+def text_component(runs):
+    """
+    Returns the shortest text component for some runs: a plain string for unstyled text, an object for
+    one styled run, or a list whose first element is unstyled, since later elements inherit its style.
+    """
+    parts = []
+    for (colour, formats), text in runs:
+        if colour is None and not formats:
+            parts.append(text)
+            continue
+        part = {'text': text}
+        if colour is not None:
+            part['color'] = colour
+        for field in FORMAT_FIELDS.values():
+            if field in formats:
+                part[field] = True
+        parts.append(part)
+    if not parts:
+        return ''
+    if len(parts) == 1:
+        return parts[0]
+    return parts if isinstance(parts[0], str) else [''] + parts
+
+
+def legacy_text(runs):
+    """
+    Returns some runs as a single string with the fewest § formatting codes, only writing codes where
+    the style changes, and only the added format codes where the formatting grows in the same colour.
+    """
+    text = ''
+    colour, formats = DEFAULT_STYLE
+    for (run_colour, run_formats), run_text in runs:
+        if run_colour == colour and run_formats >= formats:
+            added = run_formats - formats
+        else:
+            text += FORMAT_CODE + (COLOURS[run_colour] if run_colour else 'r')
+            added = run_formats
+        text += ''.join(FORMAT_CODE + FORMAT_CODES[field] for field in FORMAT_FIELDS.values() if field in added)
+        text += run_text
+        colour, formats = run_colour, run_formats
+    return text
+
+
+def page_json(page):
+    """
+    Converts a book page with § formatting codes into the shortest JSON text for it: either text components,
+    or a single string with the fewest formatting codes, whichever is shorter.
+    """
+    runs = parse_runs(page)
+    encodings = [json.dumps(text_component(runs), separators=(',', ':'), ensure_ascii=False),
+                 json.dumps(legacy_text(runs), ensure_ascii=False)]
+    return min(encodings, key=len)
+
+
+def snbt_string(text, quote='"'):
+    """
+    Quotes a string for SNBT, escaping backslashes and the quote character.
+    """
+    return quote + text.replace('\\', '\\\\').replace(quote, '\\' + quote) + quote
+
+
+def give_command(title, author, pages, target='@s'):
+    """
+    Returns a give command for a written book with pages of JSON text, in the item component syntax of
+    Minecraft 1.21.4, which the resource pack's PACK_FORMAT targets.
+    """
+    pages = ','.join(snbt_string(page, "'") for page in pages)
+    content = f'title:{snbt_string(title)},author:{snbt_string(author)},pages:[{pages}]'
+    return f'give {target} written_book[written_book_content={{{content}}}]'
+
+
+def volume_title(title, volume, volumes):
+    """
+    Returns the title of one volume of a book, shortened to fit the title length limit.
+    """
+    suffix = f' ({volume}/{volumes})' if volumes > 1 else ''
+    return title[:MAX_TITLE_LENGTH - len(suffix)] + suffix
+
+
+def split_volumes(title, author, pages, max_length=MAX_COMMAND_LENGTH, target='@s'):
+    """
+    Splits the JSON pages of a book into as few consecutive volumes as possible, each with at most
+    MAX_BOOK_PAGES pages and a give command no longer than max_length. A page too long for a command
+    on its own is given a volume to itself.
+
+    :return: A list of the pages in each volume.
+    """
+    # The longest a volume's title can be, so that the overhead is never underestimated.
+    overhead = len(give_command(title[:MAX_TITLE_LENGTH].ljust(MAX_TITLE_LENGTH), author, [], target))
+    volumes = [[]]
+    length = overhead
+    for page in pages:
+        page_length = len(snbt_string(page, "'")) + (1 if volumes[-1] else 0)
+        if volumes[-1] and (length + page_length > max_length or len(volumes[-1]) == MAX_BOOK_PAGES):
+            volumes.append([])
+            length = overhead
+            page_length -= 1
+        volumes[-1].append(page)
+        length += page_length
+    return volumes
+
+
+def function_name(title):
+    """
+    Returns a function file name for a book title, using only the characters that function names allow.
+    """
+    return re.sub(r'[^a-z0-9_.-]+', '_', title.lower()).strip('_') or 'book'
+
+
+def export_book(book, writer, format='mcfunction', max_length=MAX_COMMAND_LENGTH, target='@s'):
+    """
+    Writes the give commands for a written book, as a .mcfunction file or a text file with one command per line.
+
+    :param book: A Script that has been written.
+    :param writer: The output to write to.
+    :param format: 'mcfunction' or 'commands'.
+    :param max_length: The longest each command may be, in characters.
+    :param target: The player selector to give the book to.
+    :return: Where the commands were written, and a dictionary of sizes for the report.
+    """
+    pages = [page_json(page) for page in book.pages]
+    volumes = split_volumes(book.title, book.author, pages, max_length, target)
+    commands = [give_command(volume_title(book.title, n + 1, len(volumes)), book.author, volume, target)
+                for n, volume in enumerate(volumes)]
+    extension = 'mcfunction' if format == 'mcfunction' else 'txt'
+    location = writer.write_bytes(f'books/{function_name(book.title)}.{extension}',
+                                  ''.join(f'{command}\n' for command in commands).encode('utf8'))
+
+    sizes = {
+        'pages': len(pages),
+        'volumes': len(volumes),
+        'legacy': sum(len(json.dumps(page, ensure_ascii=False).encode('utf8')) for page in book.pages),
+        'components': sum(len(page.encode('utf8')) for page in pages),
+        'commands': sum(len(command.encode('utf8')) + 1 for command in commands),
+        'longest': max(len(command) for command in commands),
+        'long pages': sum(len(page) > MAX_PAGE_LENGTH for page in pages),
+    }
+    return location, sizes
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export script books as give commands for written books.')
+    parser.add_argument('scripts', nargs='*', default=['scripts'],
+                        help='script files, directories of scripts or glob patterns (default: scripts)')
+    parser.add_argument('-s', '--settings', default='book_settings.json',
+                        help='a JSON file of Script arguments by script file name (default: book_settings.json)')
+    parser.add_argument('--format', choices=('mcfunction', 'commands'), default='mcfunction',
+                        help='write a function file, or a text file of commands for command blocks '
+                             '(default: mcfunction)')
+    parser.add_argument('--max-length', type=int, default=MAX_COMMAND_LENGTH,
+                        help=f'the longest each give command may be (default: {MAX_COMMAND_LENGTH})')
+    parser.add_argument('--target', default='@s',
+                        help='the player selector to give the books to (default: @s)')
+    args = parser.parse_args()
+
+    load_catalogue(icons_file=None)
+
+    print(f'{"pages":>6} {"volumes":>7} {"legacy":>8} {"text":>8} {"commands":>9} {"longest":>8}  book')
+    with OutputWriter() as writer:
+        for job in book_jobs(args.scripts, args.settings):
+            book = Script(job.pop('script'), **job)
+            book.write_script()
+            location, sizes = export_book(book, writer, args.format, args.max_length, args.target)
+            print(f'{sizes["pages"]:>6} {sizes["volumes"]:>7} {sizes["legacy"]:>8} {sizes["components"]:>8} '
+                  f'{sizes["commands"]:>9} {sizes["longest"]:>8}  {location}')
+            if sizes['long pages']:
+                print(f'{"warning":>15}  {sizes["long pages"]} pages are longer than {MAX_PAGE_LENGTH} characters')
@@ -0,0 +1 @@
+give @s written_book[written_book_content={title:"Bad Moon Rising",author:"",pages:['"\\n\\n§6§l§nBad Moon Rising"','"§1§l§nTownsfolk - Good§r\\n- §9Grandmother§r\\n- §9Sailor§r\\n- §9Chambermaid§r\\n- §9Exorcist§r\\n- §9Innkeeper§r\\n- §9Gambler§r\\n- §9Gossip§r\\n- §9Courtier§r\\n- §9Professor§r\\n- §9Minstrel§r\\n- §9Tea Lady§r\\n- §9Pacifist§r\\n- §9Fool"','"§3§l§nOutsider - Good§r\\n- §bTinker§r\\n- §bMoonchild§r\\n- §bGoon§r\\n- §bLunatic\\n\\n§c§l§nMinion - Evil§r\\n- §cGodfather§r\\n- §cDevil\'s Advocate§r\\n- §cAssassin§r\\n- §cMastermind"','"§4§l§nDemon - Evil§r\\n- §4Zombuul§r\\n- §4Pukka§r\\n- §4Shabaloth§r\\n- §4Po"','"§1§l§nGrandmother\\n§9Townsfolk - Good§r\\nYou start knowing a good player & their character. If the Demon kills them, you die too.\\n§1§l§nSailor\\n§9Townsfolk - Good§r\\nEach night, choose an alive player: either you or they are drunk until dusk. You can\'t die."','"§1§l§nChambermaid\\n§9Townsfolk - Good§r\\nEach night, choose 2 alive players (not yourself): you learn how many woke tonight due to their ability."','"§1§l§nExorcist\\n§9Townsfolk - Good§r\\nEach night*, choose a player (different to last night): the Demon, if chosen, learns who you are then doesn\'t wake tonight.\\n§1§l§nInnkeeper\\n§9Townsfolk - Good§r\\nEach night*, choose 2 players: they can\'t die tonight, but 1 is drunk until dusk."','"§1§l§nGambler\\n§9Townsfolk - Good§r\\nEach night*, choose a player & guess their character: if you guess wrong, you die.\\n§1§l§nGossip\\n§9Townsfolk - Good§r\\nEach day, you may make a public statement. Tonight, if it was true, a player dies."','"§1§l§nCourtier\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose a character: they are drunk for 3 nights & 3 days.\\n§1§l§nProfessor\\n§9Townsfolk - Good§r\\nOnce per game, at night*, choose a dead player: if they are a Townsfolk, they are resurrected."','"§1§l§nMinstrel\\n§9Townsfolk - Good§r\\nWhen a Minion dies by execution, all other players (except Travellers) are drunk until dusk tomorrow.\\n\\n§1§l§nTea Lady\\n§9Townsfolk - Good§r\\nIf both your alive neighbors are good, they can\'t die."','"§1§l§nPacifist\\n§9Townsfolk - Good§r\\nExecuted good players might not die.\\n\\n\\n\\n§1§l§nFool\\n§9Townsfolk - Good§r\\nThe 1st time you die, you don\'t."','"§3§l§nTinker\\n§bOutsider - Good§r\\nYou might die at any time.\\n\\n\\n§3§l§nMoonchild\\n§bOutsider - Good§r\\nWhen you learn that you died, publicly choose 1 alive player. Tonight, if it was a good player, they die."','"§3§l§nGoon\\n§bOutsider - Good§r\\nEach night, the 1st player to choose you with their ability is drunk until dusk. You become their alignment."','"§3§l§nLunatic\\n§bOutsider - Good§r\\nYou think you are a Demon, but you are not. The Demon knows who you are & who you choose at night."','"§c§l§nGodfather\\n§cMinion - Evil§r\\nYou start knowing which Outsiders are in play. If 1 died today, choose a player tonight: they die. [-1 or +1 Outsider]"','"§c§l§nDevil\'s Advocate\\n§cMinion - Evil§r\\nEach night, choose a living player (different to last night): if executed tomorrow, they don\'t die."','"§c§l§nAssassin\\n§cMinion - Evil§r\\nOnce per game, at night*, choose a player: they die, even if for some reason they could not."','"§c§l§nMastermind\\n§cMinion - Evil§r\\nIf the Demon dies by execution (ending the game), play for 1 more day. If a player is then executed, their team loses."','"§4§l§nZombuul\\n§4Demon - Evil§r\\nEach night*, if no-one died today, choose a player: they die. The 1st time you die, you live but register as dead."','"§4§l§nPukka\\n§4Demon - Evil§r\\nEach night, choose a player: they are poisoned. The previously poisoned player dies then becomes healthy."','"§4§l§nShabaloth\\n§4Demon - Evil§r\\nEach night*, choose 2 players: they die. A dead player you chose last night might be regurgitated."','"§4§l§nPo\\n§4Demon - Evil§r\\nEach night*, you may choose a player: they die. If your last choice was no-one, choose 3 players tonight."','"§l§nFirst Night Order§r\\n 1. §bLunatic§r\\n 2. §9Sailor§r\\n 3. §9Courtier§r\\n 4. §cGodfather§r\\n 5. §cDevil\'s Advocate§r\\n 6. §4Pukka§r\\n 7. §9Grandmother§r\\n 8. §9Chambermaid"','"§l§nOther Night Order§r\\n 1. §9Sailor§r\\n 2. §9Courtier§r\\n 3. §9Innkeeper§r\\n 4. §9Gambler§r\\n 5. §cDevil\'s Advocate§r\\n 6. §bLunatic§r\\n 7. §9Exorcist§r\\n 8. §4Zombuul§r\\n 9. §4Pukka§r\\n10. §4Shabaloth"','"§l§nOther Night Order§r\\n11. §4Po§r\\n12. §cAssassin§r\\n13. §cGodfather§r\\n14. §9Gossip§r\\n15. §9Professor§r\\n16. §bTinker§r\\n17. §bMoonchild§r\\n18. §9Grandmother§r\\n19. §9Chambermaid"']}]
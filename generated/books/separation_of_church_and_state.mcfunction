@@ -0,0 +1 @@
+give @s written_book[written_book_content={title:"Separation Of Church and State",author:"Aero",pages:['"\\n\\n§5§l§nSeparation Of Church and State\\n\\n\\n§d§lBy Aero"','"§1§l§nTownsfolk - Good§r\\n- §9Ravenkeeper§r\\n- §9Mayor§r\\n- §9Grandmother§r\\n- §9Gossip§r\\n- §9Pacifist§r\\n- §9Dreamer§r\\n- §9Mathematician§r\\n- §9Juggler§r\\n- §9Amnesiac§r\\n- §9Engineer§r\\n- §9Knight"','"§3§l§nOutsider - Good§r\\n- §bButler§r\\n- §bTinker§r\\n- §bMoonchild\\n\\n§c§l§nMinion - Evil§r\\n- §cAssassin§r\\n- §cWidow§r\\n- §cMezepheles§r\\n- §cHarpy"','"§4§l§nDemon - Evil§r\\n- §4Vigormortis§r\\n- §4Lleech§r\\n- §4Legion\\n\\n§6§l§nFabled§r\\n- §6Sentinel"','"§1§l§nRavenkeeper\\n§9Townsfolk - Good§r\\nIf you die at night, you are woken to choose a player: you learn their character.\\n§1§l§nMayor\\n§9Townsfolk - Good§r\\nIf only 3 players live & no execution occurs, your team wins. If you die at night, another player might die instead."','"§1§l§nGrandmother\\n§9Townsfolk - Good§r\\nYou start knowing a good player & their character. If the Demon kills them, you die too.\\n§1§l§nGossip\\n§9Townsfolk - Good§r\\nEach day, you may make a public statement. Tonight, if it was true, a player dies."','"§1§l§nPacifist\\n§9Townsfolk - Good§r\\nExecuted good players might not die.\\n\\n§1§l§nDreamer\\n§9Townsfolk - Good§r\\nEach night, choose a player (not yourself or Travellers): you learn 1 good & 1 evil character, 1 of which is correct."','"§1§l§nMathematician\\n§9Townsfolk - Good§r\\nEach night, you learn how many players’ abilities worked abnormally (since dawn) due to another character\'s ability."','"§1§l§nJuggler\\n§9Townsfolk - Good§r\\nOn your 1st day, publicly guess up to 5 players\' characters. That night, you learn how many you got correct."','"§1§l§nAmnesiac\\n§9Townsfolk - Good§r\\nYou do not know what your ability is. Each day, privately guess what it is: you learn how accurate you are."','"§1§l§nEngineer\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose which Minions or which Demon is in play.\\n\\n\\n§1§l§nKnight\\n§9Townsfolk - Good§r\\nYou start knowing 2 players that are not the Demon."','"§3§l§nButler\\n§bOutsider - Good§r\\nEach night, choose a player (not yourself): tomorrow, you may only vote if they are voting too.\\n\\n\\n§3§l§nTinker\\n§bOutsider - Good§r\\nYou might die at any time."','"§3§l§nMoonchild\\n§bOutsider - Good§r\\nWhen you learn that you died, publicly choose 1 alive player. Tonight, if it was a good player, they die."','"§c§l§nAssassin\\n§cMinion - Evil§r\\nOnce per game, at night*, choose a player: they die, even if for some reason they could not."','"§c§l§nWidow\\n§cMinion - Evil§r\\nOn your 1st night, look at the Grimoire & choose a player: they are poisoned. 1 good player knows a Widow is in play."','"§c§l§nMezepheles\\n§cMinion - Evil§r\\nYou start knowing a secret word. The 1st good player to say this word becomes evil that night.\\n§c§l§nHarpy\\n§cMinion - Evil§r\\nEach night, choose 2 players: tomorrow, the 1st player is mad that the 2nd is evil, or one or both might die."','"§4§l§nVigormortis\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. Minions you kill keep their ability & poison 1 Townsfolk neighbor. [-1 Outsider]"','"§4§l§nLleech\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. You start by choosing a player: they are poisoned. You die if & only if they are dead."','"§4§l§nLegion\\n§4Demon - Evil§r\\nEach night*, a player might die. Executions fail if only evil voted. You register as a Minion too. [Most players are Legion]"','"§6§l§nSentinel\\n§6Fabled§r\\nThere might be 1 extra or 1 fewer Outsider in play."','"§6§l§nJinxes\\n§4§lLegion§r & §1§lEngineer§r\\nLegion and the Engineer cannot both be in play at the start of the game. If the Engineer creates Legion, most players (including all evil players) become evil Legion."','"§l§nFirst Night Order§r\\n 1. §9Engineer§r\\n 2. §4Lleech§r\\n 3. §cWidow§r\\n 4. §cHarpy§r\\n 5. §cMezepheles§r\\n 6. §9Amnesiac§r\\n 7. §bButler§r\\n 8. §9Grandmother§r\\n 9. §9Dreamer§r\\n10. §9Knight§r\\n11. §9Mathematician"','"§l§nOther Night Order§r\\n 1. §9Engineer§r\\n 2. §cHarpy§r\\n 3. §cMezepheles§r\\n 4. §4Legion§r\\n 5. §4Vigormortis§r\\n 6. §4Lleech§r\\n 7. §cAssassin§r\\n 8. §9Gossip§r\\n 9. §9Amnesiac"','"§l§nOther Night Order§r\\n10. §bTinker§r\\n11. §bMoonchild§r\\n12. §9Grandmother§r\\n13. §9Ravenkeeper§r\\n14. §9Dreamer§r\\n15. §9Juggler§r\\n16. §bButler§r\\n17. §9Mathematician"']}]
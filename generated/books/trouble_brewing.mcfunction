@@ -0,0 +1 @@
+give @s written_book[written_book_content={title:"Trouble Brewing",author:"",pages:['"\\n\\n§4§l§nTrouble Brewing"','"§1§l§nTownsfolk - Good§r\\n- §9Washerwoman§r\\n- §9Librarian§r\\n- §9Investigator§r\\n- §9Chef§r\\n- §9Empath§r\\n- §9Fortune Teller§r\\n- §9Undertaker§r\\n- §9Monk§r\\n- §9Ravenkeeper§r\\n- §9Virgin§r\\n- §9Slayer§r\\n- §9Soldier§r\\n- §9Mayor"','"§3§l§nOutsider - Good§r\\n- §bButler§r\\n- §bDrunk§r\\n- §bRecluse§r\\n- §bSaint\\n\\n§c§l§nMinion - Evil§r\\n- §cPoisoner§r\\n- §cSpy§r\\n- §cScarlet Woman§r\\n- §cBaron\\n\\n§4§l§nDemon - Evil§r\\n- §4Imp"','"§1§l§nWasherwoman\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Townsfolk.\\n\\n§1§l§nLibrarian\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Outsider. (Or that zero are in play.)"','"§1§l§nInvestigator\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Minion.\\n\\n\\n\\n§1§l§nChef\\n§9Townsfolk - Good§r\\nYou start knowing how many pairs of evil players there are."','"§1§l§nEmpath\\n§9Townsfolk - Good§r\\nEach night, you learn how many of your 2 alive neighbors are evil.\\n§1§l§nFortune Teller\\n§9Townsfolk - Good§r\\nEach night, choose 2 players: you learn if either is a Demon. There is a good player that registers as a Demon to you."','"§1§l§nUndertaker\\n§9Townsfolk - Good§r\\nEach night*, you learn which character died by execution today.\\n\\n\\n§1§l§nMonk\\n§9Townsfolk - Good§r\\nEach night*, choose a player (not yourself): they are safe from the Demon tonight."','"§1§l§nRavenkeeper\\n§9Townsfolk - Good§r\\nIf you die at night, you are woken to choose a player: you learn their character.\\n§1§l§nVirgin\\n§9Townsfolk - Good§r\\nThe 1st time you are nominated, if the nominator is a Townsfolk, they are executed immediately."','"§1§l§nSlayer\\n§9Townsfolk - Good§r\\nOnce per game, during the day, publicly choose a player: if they are the Demon, they die.\\n\\n\\n§1§l§nSoldier\\n§9Townsfolk - Good§r\\nYou are safe from the Demon."','"§1§l§nMayor\\n§9Townsfolk - Good§r\\nIf only 3 players live & no execution occurs, your team wins. If you die at night, another player might die instead."','"§3§l§nButler\\n§bOutsider - Good§r\\nEach night, choose a player (not yourself): tomorrow, you may only vote if they are voting too.\\n§3§l§nDrunk\\n§bOutsider - Good§r\\nYou do not know you are the Drunk. You think you are a Townsfolk character, but you are not."','"§3§l§nRecluse\\n§bOutsider - Good§r\\nYou might register as evil & as a Minion or Demon, even if dead.\\n\\n\\n\\n§3§l§nSaint\\n§bOutsider - Good§r\\nIf you die by execution, your team loses."','"§c§l§nPoisoner\\n§cMinion - Evil§r\\nEach night, choose a player: they are poisoned tonight and tomorrow day.\\n§c§l§nSpy\\n§cMinion - Evil§r\\nEach night, you see the Grimoire. You might register as good & as a Townsfolk or Outsider, even if dead."','"§c§l§nScarlet Woman\\n§cMinion - Evil§r\\nIf there are 5 or more players alive & the Demon dies, you become the Demon. (Travellers don\'t count.)\\n§c§l§nBaron\\n§cMinion - Evil§r\\nThere are extra Outsiders in play. [+2 Outsiders]"','"§4§l§nImp\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. If you kill yourself this way, a Minion becomes the Imp."','"§l§nFirst Night Order§r\\n 1. §cPoisoner§r\\n 2. §9Washerwoman§r\\n 3. §9Librarian§r\\n 4. §9Investigator§r\\n 5. §9Chef§r\\n 6. §9Empath§r\\n 7. §9Fortune Teller§r\\n 8. §bButler§r\\n 9. §cSpy"','"§l§nOther Night Order§r\\n 1. §cPoisoner§r\\n 2. §9Monk§r\\n 3. §cScarlet Woman§r\\n 4. §4Imp§r\\n 5. §9Ravenkeeper§r\\n 6. §9Empath§r\\n 7. §9Fortune Teller§r\\n 8. §9Undertaker§r\\n 9. §bButler§r\\n10. §cSpy"']}]
@@ -0,0 +1,3 @@
+give @s written_book[written_book_content={title:"Whalebucket (1/3)",author:"",pages:['"\\n\\n§l§nWhalebucket"','"§1§l§nTownsfolk - Good§r\\n- §9Washerwoman§r\\n- §9Librarian§r\\n- §9Investigator§r\\n- §9Chef§r\\n- §9Empath§r\\n- §9Fortune Teller§r\\n- §9Undertaker§r\\n- §9Monk§r\\n- §9Ravenkeeper§r\\n- §9Virgin§r\\n- §9Slayer§r\\n- §9Soldier§r\\n- §9Mayor"','"§1§l§nTownsfolk - Good§r\\n- §9Grandmother§r\\n- §9Sailor§r\\n- §9Chambermaid§r\\n- §9Exorcist§r\\n- §9Innkeeper§r\\n- §9Gambler§r\\n- §9Gossip§r\\n- §9Courtier§r\\n- §9Professor§r\\n- §9Minstrel§r\\n- §9Tea Lady§r\\n- §9Pacifist§r\\n- §9Fool"','"§1§l§nTownsfolk - Good§r\\n- §9Clockmaker§r\\n- §9Dreamer§r\\n- §9Snake Charmer§r\\n- §9Mathematician§r\\n- §9Flowergirl§r\\n- §9Town Crier§r\\n- §9Oracle§r\\n- §9Savant§r\\n- §9Seamstress§r\\n- §9Philosopher§r\\n- §9Artist§r\\n- §9Juggler§r\\n- §9Sage"','"§1§l§nTownsfolk - Good§r\\n- §9Noble§r\\n- §9Bounty Hunter§r\\n- §9Pixie§r\\n- §9General§r\\n- §9Preacher§r\\n- §9King§r\\n- §9Balloonist§r\\n- §9Cult Leader§r\\n- §9Lycanthrope§r\\n- §9Amnesiac§r\\n- §9Nightwatchman§r\\n- §9Engineer§r\\n- §9Fisherman"','"§1§l§nTownsfolk - Good§r\\n- §9Huntsman§r\\n- §9Alchemist§r\\n- §9Farmer§r\\n- §9Magician§r\\n- §9Choirboy§r\\n- §9Poppy Grower§r\\n- §9Atheist§r\\n- §9Cannibal§r\\n- §9Acrobat§r\\n- §9Knight§r\\n- §9Steward§r\\n- §9High Priestess§r\\n- §9Shugenja"','"§1§l§nTownsfolk - Good§r\\n- §9Village Idiot§r\\n- §9Banshee§r\\n- §9Alsaahir§r\\n- §9Princess"','"§3§l§nOutsider - Good§r\\n- §bButler§r\\n- §bDrunk§r\\n- §bRecluse§r\\n- §bSaint§r\\n- §bTinker§r\\n- §bMoonchild§r\\n- §bGoon§r\\n- §bLunatic§r\\n- §bMutant§r\\n- §bSweetheart§r\\n- §bBarber§r\\n- §bKlutz§r\\n- §bSnitch"','"§3§l§nOutsider - Good§r\\n- §bPuzzlemaster§r\\n- §bHeretic§r\\n- §bDamsel§r\\n- §bGolem§r\\n- §bPolitician§r\\n- §bPlague Doctor§r\\n- §bHatter§r\\n- §bOgre§r\\n- §bZealot§r\\n- §bHermit"','"§c§l§nMinion - Evil§r\\n- §cPoisoner§r\\n- §cSpy§r\\n- §cScarlet Woman§r\\n- §cBaron§r\\n- §cGodfather§r\\n- §cDevil\'s Advocate§r\\n- §cAssassin§r\\n- §cMastermind§r\\n- §cEvil Twin§r\\n- §cWitch§r\\n- §cCerenovus§r\\n- §cPit-Hag§r\\n- §cWidow"','"§c§l§nMinion - Evil§r\\n- §cFearmonger§r\\n- §cPsychopath§r\\n- §cGoblin§r\\n- §cMezepheles§r\\n- §cMarionette§r\\n- §cBoomdandy§r\\n- §cOrgan Grinder§r\\n- §cVizier§r\\n- §cHarpy§r\\n- §cSummoner§r\\n- §cBoffin§r\\n- §cXaan§r\\n- §cWizard"','"§c§l§nMinion - Evil§r\\n- §cWraith"','"§4§l§nDemon - Evil§r\\n- §4Imp§r\\n- §4Zombuul§r\\n- §4Pukka§r\\n- §4Shabaloth§r\\n- §4Po§r\\n- §4Fang Gu§r\\n- §4Vigormortis§r\\n- §4No Dashii§r\\n- §4Vortox§r\\n- §4Lil\' Monsta§r\\n- §4Lleech§r\\n- §4Al-Hadikhia§r\\n- §4Legion"','"§4§l§nDemon - Evil§r\\n- §4Leviathan§r\\n- §4Riot§r\\n- §4Ojo§r\\n- §4Kazali§r\\n- §4Yaggababble§r\\n- §4Lord of Typhon"','"§1§l§nWasherwoman\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Townsfolk.\\n\\n§1§l§nLibrarian\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Outsider. (Or that zero are in play.)"','"§1§l§nInvestigator\\n§9Townsfolk - Good§r\\nYou start knowing that 1 of 2 players is a particular Minion.\\n\\n\\n\\n§1§l§nChef\\n§9Townsfolk - Good§r\\nYou start knowing how many pairs of evil players there are."','"§1§l§nEmpath\\n§9Townsfolk - Good§r\\nEach night, you learn how many of your 2 alive neighbors are evil.\\n§1§l§nFortune Teller\\n§9Townsfolk - Good§r\\nEach night, choose 2 players: you learn if either is a Demon. There is a good player that registers as a Demon to you."','"§1§l§nUndertaker\\n§9Townsfolk - Good§r\\nEach night*, you learn which character died by execution today.\\n\\n\\n§1§l§nMonk\\n§9Townsfolk - Good§r\\nEach night*, choose a player (not yourself): they are safe from the Demon tonight."','"§1§l§nRavenkeeper\\n§9Townsfolk - Good§r\\nIf you die at night, you are woken to choose a player: you learn their character.\\n§1§l§nVirgin\\n§9Townsfolk - Good§r\\nThe 1st time you are nominated, if the nominator is a Townsfolk, they are executed immediately."','"§1§l§nSlayer\\n§9Townsfolk - Good§r\\nOnce per game, during the day, publicly choose a player: if they are the Demon, they die.\\n\\n\\n§1§l§nSoldier\\n§9Townsfolk - Good§r\\nYou are safe from the Demon."','"§1§l§nMayor\\n§9Townsfolk - Good§r\\nIf only 3 players live & no execution occurs, your team wins. If you die at night, another player might die instead."','"§1§l§nGrandmother\\n§9Townsfolk - Good§r\\nYou start knowing a good player & their character. If the Demon kills them, you die too.\\n§1§l§nSailor\\n§9Townsfolk - Good§r\\nEach night, choose an alive player: either you or they are drunk until dusk. You can\'t die."','"§1§l§nChambermaid\\n§9Townsfolk - Good§r\\nEach night, choose 2 alive players (not yourself): you learn how many woke tonight due to their ability."','"§1§l§nExorcist\\n§9Townsfolk - Good§r\\nEach night*, choose a player (different to last night): the Demon, if chosen, learns who you are then doesn\'t wake tonight.\\n§1§l§nInnkeeper\\n§9Townsfolk - Good§r\\nEach night*, choose 2 players: they can\'t die tonight, but 1 is drunk until dusk."','"§1§l§nGambler\\n§9Townsfolk - Good§r\\nEach night*, choose a player & guess their character: if you guess wrong, you die.\\n§1§l§nGossip\\n§9Townsfolk - Good§r\\nEach day, you may make a public statement. Tonight, if it was true, a player dies."','"§1§l§nCourtier\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose a character: they are drunk for 3 nights & 3 days.\\n§1§l§nProfessor\\n§9Townsfolk - Good§r\\nOnce per game, at night*, choose a dead player: if they are a Townsfolk, they are resurrected."','"§1§l§nMinstrel\\n§9Townsfolk - Good§r\\nWhen a Minion dies by execution, all other players (except Travellers) are drunk until dusk tomorrow.\\n\\n§1§l§nTea Lady\\n§9Townsfolk - Good§r\\nIf both your alive neighbors are good, they can\'t die."','"§1§l§nPacifist\\n§9Townsfolk - Good§r\\nExecuted good players might not die.\\n§1§l§nFool\\n§9Townsfolk - Good§r\\nThe 1st time you die, you don\'t.\\n§1§l§nClockmaker\\n§9Townsfolk - Good§r\\nYou start knowing how many steps from the Demon to its nearest Minion."','"§1§l§nDreamer\\n§9Townsfolk - Good§r\\nEach night, choose a player (not yourself or Travellers): you learn 1 good & 1 evil character, 1 of which is correct."','"§1§l§nSnake Charmer\\n§9Townsfolk - Good§r\\nEach night, choose an alive player: a chosen Demon swaps characters & alignments with you & is then poisoned."','"§1§l§nMathematician\\n§9Townsfolk - Good§r\\nEach night, you learn how many players’ abilities worked abnormally (since dawn) due to another character\'s ability."','"§1§l§nFlowergirl\\n§9Townsfolk - Good§r\\nEach night*, you learn if a Demon voted today.\\n\\n\\n\\n§1§l§nTown Crier\\n§9Townsfolk - Good§r\\nEach night*, you learn if a Minion nominated today."','"§1§l§nOracle\\n§9Townsfolk - Good§r\\nEach night*, you learn how many dead players are evil.\\n\\n§1§l§nSavant\\n§9Townsfolk - Good§r\\nEach day, you may visit the Storyteller to learn 2 things in private: 1 is true & 1 is false."','"§1§l§nSeamstress\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose 2 players (not yourself): you learn if they are the same alignment."','"§1§l§nPhilosopher\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose a good character: gain that ability. If this character is in play, they are drunk.\\n§1§l§nArtist\\n§9Townsfolk - Good§r\\nOnce per game, during the day, privately ask the Storyteller any yes/no question."','"§1§l§nJuggler\\n§9Townsfolk - Good§r\\nOn your 1st day, publicly guess up to 5 players\' characters. That night, you learn how many you got correct.\\n§1§l§nSage\\n§9Townsfolk - Good§r\\nIf the Demon kills you, you learn that it is 1 of 2 players."','"§1§l§nNoble\\n§9Townsfolk - Good§r\\nYou start knowing 3 players, 1 and only 1 of which is evil.\\n§1§l§nBounty Hunter\\n§9Townsfolk - Good§r\\nYou start knowing 1 evil player. If the player you know dies, you learn another evil player tonight. [1 Townsfolk is evil]"','"§1§l§nPixie\\n§9Townsfolk - Good§r\\nYou start knowing 1 in-play Townsfolk. If you were mad that you were this character, you gain their ability when they die."','"§1§l§nGeneral\\n§9Townsfolk - Good§r\\nEach night, you learn which alignment the Storyteller believes is winning: good, evil, or neither.\\n§1§l§nPreacher\\n§9Townsfolk - Good§r\\nEach night, choose a player: a Minion, if chosen, learns this. All chosen Minions have no ability."','"§1§l§nKing\\n§9Townsfolk - Good§r\\nEach night, if the dead equal or outnumber the living, you learn 1 alive character. The Demon knows you are the King."','"§1§l§nBalloonist\\n§9Townsfolk - Good§r\\nEach night, you learn a player of a different character type than last night. [+0 or +1 Outsider]"','"§1§l§nCult Leader\\n§9Townsfolk - Good§r\\nEach night, you become the alignment of an alive neighbor. If all good players choose to join your cult, your team wins."','"§1§l§nLycanthrope\\n§9Townsfolk - Good§r\\nEach night*, choose an alive player. If good, they die & the Demon doesn’t kill tonight. One good player registers as evil."','"§1§l§nAmnesiac\\n§9Townsfolk - Good§r\\nYou do not know what your ability is. Each day, privately guess what it is: you learn how accurate you are.\\n§1§l§nNightwatchman\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose a player: they learn you are the Nightwatchman."','"§1§l§nEngineer\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose which Minions or which Demon is in play.\\n§1§l§nFisherman\\n§9Townsfolk - Good§r\\nOnce per game, during the day, visit the Storyteller for some advice to help your team win."','"§1§l§nHuntsman\\n§9Townsfolk - Good§r\\nOnce per game, at night, choose a living player: the Damsel, if chosen, becomes a not-in-play Townsfolk. [+the Damsel]"','"§1§l§nAlchemist\\n§9Townsfolk - Good§r\\nYou have a Minion ability. When using this, the Storyteller may prompt you to choose differently.\\n\\n§1§l§nFarmer\\n§9Townsfolk - Good§r\\nWhen you die at night, an alive good player becomes a Farmer."','"§1§l§nMagician\\n§9Townsfolk - Good§r\\nThe Demon thinks you are a Minion. Minions think you are a Demon.\\n\\n\\n§1§l§nChoirboy\\n§9Townsfolk - Good§r\\nIf the Demon kills the King, you learn which player is the Demon. [+the King]"','"§1§l§nPoppy Grower\\n§9Townsfolk - Good§r\\nMinions & Demons do not know each other. If you die, they learn who each other are that night."','"§1§l§nAtheist\\n§9Townsfolk - Good§r\\nThe Storyteller can break the game rules, and if executed, good wins, even if you are dead. [No evil characters]"','"§1§l§nCannibal\\n§9Townsfolk - Good§r\\nYou have the ability of the recently killed executee. If they are evil, you are poisoned until a good player dies by execution."','"§1§l§nAcrobat\\n§9Townsfolk - Good§r\\nEach night*, choose a player: if they are or become drunk or poisoned tonight, you die.\\n\\n§1§l§nKnight\\n§9Townsfolk - Good§r\\nYou start knowing 2 players that are not the Demon."','"§1§l§nSteward\\n§9Townsfolk - Good§r\\nYou start knowing 1 good player.\\n\\n\\n§1§l§nHigh Priestess\\n§9Townsfolk - Good§r\\nEach night, learn which player the Storyteller believes you should talk to most."','"§1§l§nShugenja\\n§9Townsfolk - Good§r\\nYou start knowing if your closest evil player is clockwise or anti-clockwise. If equidistant, this info is arbitrary."','"§1§l§nVillage Idiot\\n§9Townsfolk - Good§r\\nEach night, choose a player: you learn their alignment. [+0 to +2 Village Idiots. 1 of the extras is drunk]"','"§1§l§nBanshee\\n§9Townsfolk - Good§r\\nIf the Demon kills you, all players learn this. From now on, you may nominate twice per day and vote twice per nomination."','"§1§l§nAlsaahir\\n§9Townsfolk - Good§r\\nEach day, if you publicly guess which players are Minion(s) and which are Demon(s), good wins.\\n§1§l§nPrincess\\n§9Townsfolk - Good§r\\nOn your 1st day, if you nominated & executed a player, the Demon doesn\'t kill tonight."','"§3§l§nButler\\n§bOutsider - Good§r\\nEach night, choose a player (not yourself): tomorrow, you may only vote if they are voting too.\\n§3§l§nDrunk\\n§bOutsider - Good§r\\nYou do not know you are the Drunk. You think you are a Townsfolk character, but you are not."','"§3§l§nRecluse\\n§bOutsider - Good§r\\nYou might register as evil & as a Minion or Demon, even if dead.\\n\\n\\n\\n§3§l§nSaint\\n§bOutsider - Good§r\\nIf you die by execution, your team loses."','"§3§l§nTinker\\n§bOutsider - Good§r\\nYou might die at any time.\\n\\n\\n§3§l§nMoonchild\\n§bOutsider - Good§r\\nWhen you learn that you died, publicly choose 1 alive player. Tonight, if it was a good player, they die."','"§3§l§nGoon\\n§bOutsider - Good§r\\nEach night, the 1st player to choose you with their ability is drunk until dusk. You become their alignment."','"§3§l§nLunatic\\n§bOutsider - Good§r\\nYou think you are a Demon, but you are not. The Demon knows who you are & who you choose at night.\\n§3§l§nMutant\\n§bOutsider - Good§r\\nIf you are “mad” about being an Outsider, you might be executed."','"§3§l§nSweetheart\\n§bOutsider - Good§r\\nWhen you die, 1 player is drunk from now on.\\n\\n\\n§3§l§nBarber\\n§bOutsider - Good§r\\nIf you died today or tonight, the Demon may choose 2 players (not another Demon) to swap characters."','"§3§l§nKlutz\\n§bOutsider - Good§r\\nWhen you learn that you died, publicly choose 1 alive player: if they are evil, your team loses.\\n\\n\\n§3§l§nSnitch\\n§bOutsider - Good§r\\nEach Minion gets 3 bluffs."','"§3§l§nPuzzlemaster\\n§bOutsider - Good§r\\n1 player is drunk, even if you die. If you guess (once) who it is, learn the Demon player, but guess wrong & get false info.\\n§3§l§nHeretic\\n§bOutsider - Good§r\\nWhoever wins, loses & whoever loses, wins, even if you are dead."','"§3§l§nDamsel\\n§bOutsider - Good§r\\nAll Minions know a Damsel is in play. If a Minion publicly guesses you (once), your team loses.\\n§3§l§nGolem\\n§bOutsider - Good§r\\nYou may only nominate once per game. When you do, if the nominee is not the Demon, they die."','"§3§l§nPolitician\\n§bOutsider - Good§r\\nIf you were the player most responsible for your team losing, you change alignment & win, even if dead.\\n§3§l§nPlague Doctor\\n§bOutsider - Good§r\\nWhen you die, the Storyteller gains a Minion ability."','"§3§l§nHatter\\n§bOutsider - Good§r\\nIf you died today or tonight, the Minion & Demon players may choose new Minion & Demon characters to be."','"§3§l§nOgre\\n§bOutsider - Good§r\\nOn your 1st night, choose a player (not yourself): you become their alignment (you don\'t know which) even if drunk or poisoned."','"§3§l§nZealot\\n§bOutsider - Good§r\\nIf there are 5 or more players alive, you must vote for every nomination.\\n\\n\\n§3§l§nHermit\\n§bOutsider - Good§r\\nYou have all Outsider abilities. [-0 or -1 Outsider]"','"§c§l§nPoisoner\\n§cMinion - Evil§r\\nEach night, choose a player: they are poisoned tonight and tomorrow day.\\n§c§l§nSpy\\n§cMinion - Evil§r\\nEach night, you see the Grimoire. You might register as good & as a Townsfolk or Outsider, even if dead."','"§c§l§nScarlet Woman\\n§cMinion - Evil§r\\nIf there are 5 or more players alive & the Demon dies, you become the Demon. (Travellers don\'t count.)\\n§c§l§nBaron\\n§cMinion - Evil§r\\nThere are extra Outsiders in play. [+2 Outsiders]"','"§c§l§nGodfather\\n§cMinion - Evil§r\\nYou start knowing which Outsiders are in play. If 1 died today, choose a player tonight: they die. [-1 or +1 Outsider]"','"§c§l§nDevil\'s Advocate\\n§cMinion - Evil§r\\nEach night, choose a living player (different to last night): if executed tomorrow, they don\'t die."','"§c§l§nAssassin\\n§cMinion - Evil§r\\nOnce per game, at night*, choose a player: they die, even if for some reason they could not."','"§c§l§nMastermind\\n§cMinion - Evil§r\\nIf the Demon dies by execution (ending the game), play for 1 more day. If a player is then executed, their team loses."','"§c§l§nEvil Twin\\n§cMinion - Evil§r\\nYou & an opposing player know each other. If the good player is executed, evil wins. Good can\'t win if you both live."','"§c§l§nWitch\\n§cMinion - Evil§r\\nEach night, choose a player: if they nominate tomorrow, they die. If just 3 players live, you lose this ability."','"§c§l§nCerenovus\\n§cMinion - Evil§r\\nEach night, choose a player & a good character: they are “mad” they are this character tomorrow, or might be executed."','"§c§l§nPit-Hag\\n§cMinion - Evil§r\\nEach night*, choose a player & a character they become (if not in play). If a Demon is made, deaths tonight are arbitrary."','"§c§l§nWidow\\n§cMinion - Evil§r\\nOn your 1st night, look at the Grimoire & choose a player: they are poisoned. 1 good player knows a Widow is in play."','"§c§l§nFearmonger\\n§cMinion - Evil§r\\nEach night, choose a player: if you nominate & execute them, their team loses. All players know if you choose a new player."','"§c§l§nPsychopath\\n§cMinion - Evil§r\\nEach day, before nominations, you may publicly choose a player: they die. If executed, you only die if you lose roshambo."','"§c§l§nGoblin\\n§cMinion - Evil§r\\nIf you publicly claim to be the Goblin when nominated & are executed that day, your team wins.\\n§c§l§nMezepheles\\n§cMinion - Evil§r\\nYou start knowing a secret word. The 1st good player to say this word becomes evil that night."','"§c§l§nMarionette\\n§cMinion - Evil§r\\nYou think you are a good character, but you are not. The Demon knows who you are. [You neighbor the Demon]"','"§c§l§nBoomdandy\\n§cMinion - Evil§r\\nIf you are executed, all but 3 players die. After a 10 to 1 countdown, the player with the most players pointing at them, dies."','"§c§l§nOrgan Grinder\\n§cMinion - Evil§r\\nAll players keep their eyes closed when voting and the vote tally is secret. Each night, choose if you are drunk until dusk."','"§c§l§nVizier\\n§cMinion - Evil§r\\nAll players know you are the Vizier. You cannot die during the day. If good voted, you may choose to execute immediately."','"§c§l§nHarpy\\n§cMinion - Evil§r\\nEach night, choose 2 players: tomorrow, the 1st player is mad that the 2nd is evil, or one or both might die.\\n§c§l§nSummoner\\n§cMinion - Evil§r\\nYou get 3 bluffs. On the 3rd night, choose a player: they become an evil Demon of your choice. [No Demon]"','"§c§l§nBoffin\\n§cMinion - Evil§r\\nThe Demon (even if drunk or poisoned) has a not-in-play good character’s ability. You both know which.\\n§c§l§nXaan\\n§cMinion - Evil§r\\nOn night X, all Townsfolk are poisoned until dusk. [X Outsiders]"','"§c§l§nWizard\\n§cMinion - Evil§r\\nOnce per game, choose to make a wish. If granted, it might have a price & leave a clue as to its nature.\\n§c§l§nWraith\\n§cMinion - Evil§r\\nYou may choose to open your eyes at night. You wake when other evil players do."','"§4§l§nImp\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. If you kill yourself this way, a Minion becomes the Imp."','"§4§l§nZombuul\\n§4Demon - Evil§r\\nEach night*, if no-one died today, choose a player: they die. The 1st time you die, you live but register as dead."','"§4§l§nPukka\\n§4Demon - Evil§r\\nEach night, choose a player: they are poisoned. The previously poisoned player dies then becomes healthy."','"§4§l§nShabaloth\\n§4Demon - Evil§r\\nEach night*, choose 2 players: they die. A dead player you chose last night might be regurgitated."','"§4§l§nPo\\n§4Demon - Evil§r\\nEach night*, you may choose a player: they die. If your last choice was no-one, choose 3 players tonight."','"§4§l§nFang Gu\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. The 1st Outsider this kills becomes an evil Fang Gu & you die instead. [+1 Outsider]"','"§4§l§nVigormortis\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. Minions you kill keep their ability & poison 1 Townsfolk neighbor. [-1 Outsider]\\n§4§l§nNo Dashii\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. Your 2 Townsfolk neighbors are poisoned."','"§4§l§nVortox\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. Townsfolk abilities yield false info. Each day, if no-one is executed, evil wins."','"§4§l§nLil\' Monsta\\n§4Demon - Evil§r\\nEach night, Minions choose who babysits Lil\' Monsta & \\"is the Demon\\". Each night*, a player might die. [+1 Minion]"']}]
+give @s written_book[written_book_content={title:"Whalebucket (2/3)",author:"",pages:['"§4§l§nLleech\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. You start by choosing a player: they are poisoned. You die if & only if they are dead."','"§4§l§nAl-Hadikhia\\n§4Demon - Evil§r\\nEach night*, you may choose 3 players (all players learn who): each silently chooses to live or die, but if all live, all die."','"§4§l§nLegion\\n§4Demon - Evil§r\\nEach night*, a player might die. Executions fail if only evil voted. You register as a Minion too. [Most players are Legion]"','"§4§l§nLeviathan\\n§4Demon - Evil§r\\nIf more than 1 good player is executed, evil wins. All players know you are in play. After day 5, evil wins."','"§4§l§nRiot\\n§4Demon - Evil§r\\nOn day 3, Minions become Riot & nominees die but nominate an alive player immediately. This must happen."','"§4§l§nOjo\\n§4Demon - Evil§r\\nEach night*, choose a character: they die. If they are not in play, the Storyteller chooses who dies.\\n§4§l§nKazali\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. [You choose which players are which Minions. -? to +? Outsiders]"','"§4§l§nYaggababble\\n§4Demon - Evil§r\\nYou start knowing a secret phrase. For each time you said it publicly today, a player might die."','"§4§l§nLord of Typhon\\n§4Demon - Evil§r\\nEach night*, choose a player: they die. [Evil characters are in a line. You are in the middle. +1 Minion. -? to +? Outsiders]"','"§6§l§nJinxes\\n§3§lButler§r & §c§lOrgan Grinder§r\\nIf the Organ Grinder is causing eyes closed voting, the Butler may raise their hand to vote but their vote is only counted if their master voted too."','"§6§l§nJinxes\\n§c§lSpy§r & §1§lAlchemist§r\\nIf the Alchemist has the Spy ability, they do not see the Grimoire, and the real Spy cannot register falsely.\\n§c§lSpy§r & §1§lMagician§r\\nWhen the Spy sees the Grimoire, the Demon and Magician\'s character tokens are removed."','"§6§l§nJinxes\\n§c§lSpy§r & §1§lPoppy Grower§r\\nIf the Poppy Grower is in play, the Spy does not see the Grimoire until the Poppy Grower dies.\\n\\n§c§lSpy§r & §3§lDamsel§r\\nIf the Spy is (or has been) in play, the Damsel is poisoned."','"§6§l§nJinxes\\n§c§lSpy§r & §3§lOgre§r\\nThe Spy registers as evil to the Ogre.\\n\\n\\n§c§lScarlet Woman§r & §4§lFang Gu§r\\nIf the Fang Gu chooses an Outsider and dies, the Scarlet Woman does not become the Fang Gu."','"§6§l§nJinxes\\n§c§lScarlet Woman§r & §4§lAl-Hadikhia§r\\nIf there are two living Al-Hadikhias, the Scarlet Woman Al-Hadikhia becomes the Scarlet Woman again."','"§6§l§nJinxes\\n§c§lMastermind§r & §4§lAl-Hadikhia§r\\nIf the Al-Hadikhia dies by execution, and the Mastermind is alive, the Al-Hadikhia chooses 3 good players tonight: if all 3 choose to live, evil wins. Otherwise, good wins."','"§6§l§nJinxes\\n§1§lMathematician§r & §1§lChambermaid§r\\nThe Chambermaid learns if the Mathematician wakes tonight or not, even though the Chambermaid wakes first."','"§6§l§nJinxes\\n§1§lMathematician§r & §3§lLunatic§r\\nThe Mathematician learns if the Lunatic attacks a different player(s) than the real Demon attacked.\\n§c§lCerenovus§r & §c§lGoblin§r\\nThe Cerenovus may choose to make a player mad that they are the Goblin."','"§6§l§nJinxes\\n§c§lPit-Hag§r & §3§lDamsel§r\\nIf a Pit-Hag creates a Damsel, the Storyteller chooses which player it is.\\n\\n§c§lPit-Hag§r & §3§lPolitician§r\\nIf the Pit-Hag turns an evil player into the Politician, they can\'t turn good due to their own ability."','"§6§l§nJinxes\\n§c§lPit-Hag§r & §1§lVillage Idiot§r\\nIf there is a spare token, the Pit-Hag can create an extra Village Idiot. If so, the drunk Village Idiot might change."','"§6§l§nJinxes\\n§c§lPit-Hag§r & §1§lCult Leader§r\\nIf the Pit-Hag turns an evil player into the Cult Leader, they can\'t turn good due to their own ability.\\n§c§lPit-Hag§r & §3§lGoon§r\\nIf the Pit-Hag turns an evil player into the Goon, they can\'t turn good due to their own ability."','"§6§l§nJinxes\\n§c§lPit-Hag§r & §3§lOgre§r\\nIf the Pit-Hag turns an evil player into the Ogre, they can\'t turn good due to their own ability.\\n§4§lVortox§r & §1§lBanshee§r\\nIf the Vortox is in play and the Demon kills the Banshee, the players still learn that the Banshee has died."','"§6§l§nJinxes\\n§1§lBounty Hunter§r & §1§lPhilosopher§r\\nIf the Philosopher gains the Bounty Hunter ability, a Townsfolk might turn evil."','"§6§l§nJinxes\\n§1§lBounty Hunter§r & §4§lKazali§r\\nAn evil Townsfolk is only created if the Bounty Hunter is still in play after the Kazali acts.\\n\\n§1§lCannibal§r & §3§lButler§r\\nIf the Cannibal gains the Butler ability, the Cannibal learns this."','"§6§l§nJinxes\\n§1§lCannibal§r & §1§lJuggler§r\\nIf the Juggler guesses on their first day and dies by execution, tonight the living Cannibal learns how many guesses the Juggler got correct.\\n§1§lCannibal§r & §3§lZealot§r\\nIf the Cannibal gains the Zealot ability, the Cannibal learns this."','"§6§l§nJinxes\\n§1§lCannibal§r & §1§lPoppy Grower§r\\nIf the Cannibal eats the Poppy Grower, then dies or loses the Poppy Grower ability, the Demon and Minions learn each other that night."','"§6§l§nJinxes\\n§3§lHeretic§r & §c§lGodfather§r\\nOnly 1 jinxed character can be in play.\\n§3§lHeretic§r & §c§lBaron§r\\nThe Baron might only add 1 Outsider, not 2.\\n§3§lHeretic§r & §c§lPit-Hag§r\\nA Pit-Hag cannot create a Heretic."','"§6§l§nJinxes\\n§3§lHeretic§r & §c§lSpy§r\\nOnly 1 jinxed character can be in play.\\n\\n\\n\\n§3§lHeretic§r & §c§lWidow§r\\nOnly 1 jinxed character can be in play."','"§6§l§nJinxes\\n§3§lHeretic§r & §4§lLleech§r\\nIf the Lleech has poisoned the Heretic then the Lleech dies, the Heretic remains poisoned.\\n\\n\\n§3§lHeretic§r & §c§lBoffin§r\\nThe Demon cannot have the Heretic ability."','"§6§l§nJinxes\\n§c§lWidow§r & §1§lAlchemist§r\\nIf the Alchemist has the Widow ability, they do not see the Grimoire.\\n\\n§c§lWidow§r & §1§lMagician§r\\nWhen the Widow sees the Grimoire, the Demon and Magician\'s character tokens are removed."','"§6§l§nJinxes\\n§c§lWidow§r & §1§lPoppy Grower§r\\nIf the Poppy Grower is in play, the Widow does not see the Grimoire until the Poppy Grower dies.\\n\\n§c§lWidow§r & §3§lDamsel§r\\nIf the Widow is (or has been) in play, the Damsel is poisoned."','"§6§l§nJinxes\\n§c§lMarionette§r & §4§lLil\' Monsta§r\\nThe Marionette neighbors a Minion, not the Demon. The Marionette is not woken to choose who takes the Lil\' Monsta token, and does not learn they are the Marionette if they have the Lil\' Monsta token."','"§6§l§nJinxes\\n§c§lMarionette§r & §1§lPoppy Grower§r\\nWhen the Poppy Grower dies, the Demon learns the Marionette but the Marionette learns nothing."','"§6§l§nJinxes\\n§c§lMarionette§r & §3§lSnitch§r\\nThe Marionette does not learn 3 not in-play characters. The Demon learns an extra 3 instead.\\n§c§lMarionette§r & §1§lBalloonist§r\\nIf the Marionette thinks that they are the Balloonist, +1 Outsider might have been added."','"§6§l§nJinxes\\n§c§lMarionette§r & §3§lDamsel§r\\nThe Marionette does not learn that a Damsel is in play.\\n\\n§c§lMarionette§r & §1§lHuntsman§r\\nIf the Marionette thinks that they are the Huntsman, the Damsel was added."','"§6§l§nJinxes\\n§4§lLil\' Monsta§r & §1§lPoppy Grower§r\\nIf the Poppy Grower is in play, Minions don\'t wake together. They are woken one by one, until one of them chooses to take the Lil\' Monsta token."','"§6§l§nJinxes\\n§4§lLil\' Monsta§r & §1§lMagician§r\\nEach night, the Magician chooses a Minion: if that Minion & Lil\' Monsta are alive, that Minion babysits Lil’ Monsta."','"§6§l§nJinxes\\n§4§lLil\' Monsta§r & §c§lScarlet Woman§r\\nIf there are 5 or more players alive and the player holding the Lil\' Monsta token dies, the Scarlet Woman is given the Lil\' Monsta token tonight."','"§6§l§nJinxes\\n§4§lLil\' Monsta§r & §c§lVizier§r\\nThe Vizier can die by execution if they are babysitting Lil\' Monsta.\\n\\n\\n§4§lLil\' Monsta§r & §3§lHatter§r\\nIf a Demon chooses Lil\' Monsta, they also choose a Minion to become and babysit Lil\' Monsta tonight."','"§6§l§nJinxes\\n§4§lLleech§r & §c§lMastermind§r\\nIf the Mastermind is alive and the Lleech\'s host dies by execution, the Lleech lives but loses their ability.\\n§4§lLleech§r & §1§lSlayer§r\\nIf the Slayer slays the Lleech\'s host, the host dies."','"§6§l§nJinxes\\n§4§lLegion§r & §1§lEngineer§r\\nLegion and the Engineer cannot both be in play at the start of the game. If the Engineer creates Legion, most players (including all evil players) become evil Legion."','"§6§l§nJinxes\\n§4§lLegion§r & §1§lPreacher§r\\nIf the Preacher chooses Legion, Legion keeps their ability, but the Preacher might learn they are Legion."','"§6§l§nJinxes\\n§4§lLegion§r & §1§lMinstrel§r\\nIf Legion died by execution today, Legion keeps their ability, but the Minstrel might learn they are Legion."','"§6§l§nJinxes\\n§4§lLegion§r & §3§lHatter§r\\nIf the Hatter dies and Legion is in play, nothing happens. If the Hatter dies and an evil player chooses Legion, all current evil players become Legion."','"§6§l§nJinxes\\n§4§lLegion§r & §3§lZealot§r\\nThe Zealot might register as evil to Legion\'s ability.\\n\\n\\n\\n§4§lLeviathan§r & §1§lSoldier§r\\nIf the Leviathan is in play, the Soldier is safe from all evil abilities."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lMonk§r\\nIf the Leviathan is in play, the Monk-protected-player is safe from all evil abilities.\\n§4§lLeviathan§r & §1§lInnkeeper§r\\nIf the Leviathan is in play, the Innkeeper-protected-players are safe from all evil abilities."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lRavenkeeper§r\\nEach night*, the Leviathan chooses an alive player (different to previous nights): a chosen Ravenkeeper uses their ability but does not die."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lBanshee§r\\nEach night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Banshee dies & gains their ability."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lSage§r\\nEach night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Sage uses their ability but does not die."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lFarmer§r\\nEach night*, the Leviathan chooses an alive good player (different to previous nights): a chosen Farmer uses their ability but does not die."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lMayor§r\\nIf the Leviathan is in play & no execution occurs on day 5, good wins."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lExorcist§r\\nEvil does not win when more than 1 good player has been executed, if the Exorcist is alive and has ever successfully chosen the Leviathan."','"§6§l§nJinxes\\n§4§lLeviathan§r & §1§lGrandmother§r\\nIf Leviathan is in play and the Grandchild dies by execution, evil wins.\\n§4§lLeviathan§r & §1§lKing§r\\nIf the Leviathan is in play, and at least 1 player is dead, the King learns an alive character each night."','"§6§l§nJinxes\\n§4§lLeviathan§r & §3§lHatter§r\\nIf the Hatter dies on or after day 5, the Demon cannot choose Leviathan.\\n\\n\\n\\n§4§lLeviathan§r & §c§lPit-Hag§r\\nAfter day 5, the Pit-Hag cannot choose Leviathan."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lMayor§r\\nThe Mayor may choose to stop nominations. If they do so when only 1 Riot is alive, good wins. Otherwise, evil wins.\\n§4§lRiot§r & §1§lMonk§r\\nIf Riot is in play, the Monk-protected player is safe from all evil abilities."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lFarmer§r\\nEach night*, Riot chooses an alive good player (different to previous nights): a chosen Farmer uses their ability but does not die.\\n§4§lRiot§r & §1§lInnkeeper§r\\nIf Riot is in play, the Innkeeper-protected player is safe from all evil abilities."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lSage§r\\nEach night*, Riot chooses an alive good player (different to previous nights): a chosen Sage uses their ability but does not die."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lBanshee§r\\nEach night*, Riot chooses an alive good player (different to previous nights): a chosen Banshee dies & gains their ability."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lRavenkeeper§r\\nEach night*, Riot chooses an alive good player (different to previous nights): a chosen Ravenkeeper uses their ability but does not die."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lSoldier§r\\nIf Riot is in play, the Soldier is safe from all evil abilities.\\n\\n\\n\\n§4§lRiot§r & §1§lGrandmother§r\\nIf Riot is in play and the Grandchild dies during the day, the Grandmother dies too."','"§6§l§nJinxes\\n§4§lRiot§r & §1§lKing§r\\nIf Riot is in play, and at least 1 player is dead, the King learns an alive character each night.\\n\\n§4§lRiot§r & §1§lExorcist§r\\nIf the Exorcist chooses Riot on the 3rd night, Minions do not become Riot."','"§6§l§nJinxes\\n§c§lVizier§r & §1§lInvestigator§r\\nIf the Investigator learns that the Vizier is in play, the existence of the Vizier is not announced by the Storyteller."','"§6§l§nJinxes\\n§c§lVizier§r & §1§lPreacher§r\\nIf the Vizier loses their ability, they learn this. If the Vizier is executed while they have their ability, their team wins."','"§6§l§nJinxes\\n§c§lVizier§r & §1§lCourtier§r\\nIf the Vizier loses their ability, they learn this. If the Vizier is executed while they have their ability, their team wins.\\n§c§lVizier§r & §1§lMagician§r\\nIf the Vizier and Magician are both in play, the Demon does not learn the Minions."','"§6§l§nJinxes\\n§c§lVizier§r & §c§lFearmonger§r\\nThe Vizier wakes with the Fearmonger, learns who they choose and cannot choose to immediately execute that player."','"§6§l§nJinxes\\n§c§lVizier§r & §3§lPolitician§r\\nThe Politician might register as evil to the Vizier.\\n\\n\\n\\n§c§lVizier§r & §1§lAlsaahir§r\\nIf the Vizier is in play, the Alsaahir must also guess which Demon(s) are in play."','"§6§l§nJinxes\\n§c§lVizier§r & §3§lZealot§r\\nThe Zealot might register as evil to the Vizier.\\n\\n\\n§3§lPlague Doctor§r & §c§lEvil Twin§r\\nThe Storyteller cannot gain the Evil Twin ability if the Plague Doctor dies."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lFearmonger§r\\nIf the Plague Doctor dies, a living Minion gains the Fearmonger ability in addition to their own ability, and learns this."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lGoblin§r\\nIf the Plague Doctor dies, a living Minion gains the Goblin ability in addition to their own ability, and learns this."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lSpy§r\\nIf the Plague Doctor dies, a living Minion gains the Spy ability in addition to their own ability, and learns this."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lScarlet Woman§r\\nIf the Plague Doctor dies, a living Minion gains the Scarlet Woman ability in addition to their own ability, and learns this."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lBoomdandy§r\\nIf the Plague Doctor is executed and the Storyteller would gain the Boomdandy ability, the Boomdandy ability triggers immediately."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lBaron§r\\nIf the Storyteller gains the Baron ability, up to two players become not-in-play Outsiders."','"§6§l§nJinxes\\n§3§lPlague Doctor§r & §c§lMarionette§r\\nIf the Demon has a neighbor who is alive and a Townsfolk or Outsider when the Plague Doctor dies, that player becomes an evil Marionette. If there is already an extra evil player, this does not happen."','"§6§l§nJinxes\\n§4§lKazali§r & §3§lGoon§r\\nThe Kazali can choose that the Goon player is one of their evil Minions.\\n\\n§4§lKazali§r & §c§lMarionette§r\\nIf the Kazali chooses to create a Marionette, they must choose one of their neighbors."','"§6§l§nJinxes\\n§4§lKazali§r & §1§lHuntsman§r\\nIf the Kazali chooses the Damsel to become a Minion, and a Huntsman is in play, a good player becomes the Damsel.\\n§4§lKazali§r & §1§lChoirboy§r\\nThe Kazali cannot choose the King to become a Minion if a Choirboy is in play."','"§6§l§nJinxes\\n§4§lKazali§r & §1§lSoldier§r\\nThe Kazali can choose that the Soldier player is one of their evil Minions.\\n§4§lYaggababble§r & §1§lExorcist§r\\nIf the Exorcist chooses the Yaggababble, the Yaggababble ability does not kill tonight."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lClockmaker§r\\nIf the Summoner is in play, the Clockmaker does not receive their information until a Demon is created."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lAlchemist§r\\nIf there is an Alchemist-Summoner in play, the game starts with a Demon in play, as normal. If the Alchemist-Summoner chooses a player, they make that player a Demon but do not change their alignment."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lPoppy Grower§r\\nIf the Poppy Grower is alive when the Summoner acts, the Summoner chooses which Demon, but the Storyteller chooses which player."','"§6§l§nJinxes\\n§c§lSummoner§r & §c§lMarionette§r\\nThe Marionette neighbors the Summoner. The Summoner knows who the Marionette is."','"§6§l§nJinxes\\n§c§lSummoner§r & §c§lPit-Hag§r\\nThe Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."','"§6§l§nJinxes\\n§c§lSummoner§r & §3§lHatter§r\\nThe Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lCourtier§r\\nIf the Summoner is drunk on the 3rd night, the Summoner chooses which Demon, but the Storyteller chooses which player."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lEngineer§r\\nIf the Engineer removes a Summoner from play before that Summoner uses their ability, the Summoner uses their ability immediately."','"§6§l§nJinxes\\n§c§lSummoner§r & §4§lZombuul§r\\nIf the Summoner turns a dead player into the Zombuul, the Storyteller treats that player as a Zombuul that has died once."','"§6§l§nJinxes\\n§c§lSummoner§r & §4§lPukka§r\\nThe Summoner may choose a player to become the Pukka on the 2nd night.\\n\\n§c§lSummoner§r & §4§lLegion§r\\nIf the Summoner creates Legion, most players (including all evil players) become evil Legion."','"§6§l§nJinxes\\n§c§lSummoner§r & §4§lKazali§r\\nThe Summoner cannot create an in-play Demon. If the Summoner creates a not-in-play Demon, deaths tonight are arbitrary."','"§6§l§nJinxes\\n§c§lSummoner§r & §1§lPreacher§r\\nIf the Preacher chose the Summoner on or before the 3rd night, the Summoner chooses which Demon, but the Storyteller chooses which player."','"§6§l§nJinxes\\n§c§lSummoner§r & §4§lLord of Typhon§r\\nIf the Summoner creates a Lord of Typhon, the Lord of Typhon must neighbor a Minion. The other neighbor becomes a not-in-play evil Minion."','"§6§l§nJinxes\\n§3§lOgre§r & §3§lRecluse§r\\nIf the Recluse registers as evil to the Ogre, the Ogre learns that they are evil.\\n§c§lBoffin§r & §1§lCult Leader§r\\nIf the Demon has the Cult Leader ability, they can’t turn good due to this ability."','"§6§l§nJinxes\\n§c§lBoffin§r & §3§lGoon§r\\nIf the Demon has the Goon ability, they can’t turn good due to this ability.\\n\\n\\n\\n§c§lBoffin§r & §3§lOgre§r\\nThe Demon cannot have the Ogre ability."','"§6§l§nJinxes\\n§c§lBoffin§r & §3§lPolitician§r\\nThe Demon cannot have the Politician ability.\\n\\n§c§lBoffin§r & §3§lDrunk§r\\nIf the Demon would have the Drunk ability, the Boffin chooses a Townsfolk player to have this ability instead."','"§6§l§nJinxes\\n§c§lBoffin§r & §1§lAlchemist§r\\nIf the Alchemist has the Boffin ability, the Alchemist does not learn what ability the Demon has.\\n§c§lBoffin§r & §1§lVillage Idiot§r\\nIf there is a spare token, the Boffin can give the Demon the Village Idiot ability."','"§l§nFirst Night Order§r\\n 1. §4Lord of Typhon§r\\n 2. §4Kazali§r\\n 3. §cBoffin§r\\n 4. §9Philosopher§r\\n 5. §9Alchemist§r\\n 6. §9Poppy Grower§r\\n 7. §4Yaggababble§r\\n 8. §9Magician§r\\n 9. §bSnitch§r\\n10. §bLunatic§r\\n11. §cSummoner"','"§l§nFirst Night Order§r\\n12. §9King§r\\n13. §9Sailor§r\\n14. §cMarionette§r\\n15. §9Engineer§r\\n16. §9Preacher§r\\n17. §4Lil\' Monsta§r\\n18. §4Lleech§r\\n19. §cXaan§r\\n20. §cPoisoner§r\\n21. §cWidow§r\\n22. §9Courtier"','"§l§nFirst Night Order§r\\n23. §cWizard§r\\n24. §9Snake Charmer§r\\n25. §cGodfather§r\\n26. §cOrgan Grinder§r\\n27. §cDevil\'s Advocate§r\\n28. §cEvil Twin§r\\n29. §cWitch§r\\n30. §cCerenovus§r\\n31. §cFearmonger§r\\n32. §cHarpy§r\\n33. §cMezepheles"','"§l§nFirst Night Order§r\\n34. §4Pukka§r\\n35. §9Pixie§r\\n36. §9Huntsman§r\\n37. §bDamsel§r\\n38. §9Amnesiac§r\\n39. §9Washerwoman§r\\n40. §9Librarian§r\\n41. §9Investigator§r\\n42. §9Chef§r\\n43. §9Empath§r\\n44. §9Fortune Teller"','"§l§nFirst Night Order§r\\n45. §bButler§r\\n46. §9Grandmother§r\\n47. §9Clockmaker§r\\n48. §9Dreamer§r\\n49. §9Seamstress§r\\n50. §9Steward§r\\n51. §9Knight§r\\n52. §9Noble§r\\n53. §9Balloonist§r\\n54. §9Shugenja§r\\n55. §9Village Idiot"','"§l§nFirst Night Order§r\\n56. §9Bounty Hunter§r\\n57. §9Nightwatchman§r\\n58. §9Cult Leader§r\\n59. §cSpy§r\\n60. §bOgre§r\\n61. §9High Priestess§r\\n62. §9General§r\\n63. §9Chambermaid§r\\n64. §9Mathematician§r\\n65. §4Leviathan§r\\n66. §cVizier"','"§l§nOther Night Order§r\\n 1. §9Cannibal§r\\n 2. §9Philosopher§r\\n 3. §9Poppy Grower§r\\n 4. §9Sailor§r\\n 5. §9Engineer§r\\n 6. §9Preacher§r\\n 7. §cXaan§r\\n 8. §cPoisoner§r\\n 9. §9Courtier§r\\n10. §9Innkeeper§r\\n11. §cWizard§r\\n12. §9Gambler§r\\n13. §9Acrobat"','"§l§nOther Night Order§r\\n14. §9Snake Charmer§r\\n15. §9Monk§r\\n16. §cOrgan Grinder§r\\n17. §cDevil\'s Advocate§r\\n18. §cWitch§r\\n19. §cCerenovus§r\\n20. §cPit-Hag§r\\n21. §cFearmonger§r\\n22. §cHarpy§r\\n23. §cMezepheles§r\\n24. §cScarlet Woman§r\\n25. §cSummoner§r\\n26. §bLunatic"']}]
+give @s written_book[written_book_content={title:"Whalebucket (3/3)",author:"",pages:['"§l§nOther Night Order§r\\n27. §9Exorcist§r\\n28. §9Lycanthrope§r\\n29. §4Legion§r\\n30. §9Princess§r\\n31. §4Imp§r\\n32. §4Zombuul§r\\n33. §4Pukka§r\\n34. §4Shabaloth§r\\n35. §4Po§r\\n36. §4Fang Gu§r\\n37. §4No Dashii§r\\n38. §4Vortox"','"§l§nOther Night Order§r\\n39. §4Lord of Typhon§r\\n40. §4Vigormortis§r\\n41. §4Ojo§r\\n42. §4Al-Hadikhia§r\\n43. §4Lleech§r\\n44. §4Lil\' Monsta§r\\n45. §4Yaggababble§r\\n46. §4Kazali§r\\n47. §cAssassin§r\\n48. §cGodfather§r\\n49. §9Gossip§r\\n50. §bHatter"','"§l§nOther Night Order§r\\n51. §bBarber§r\\n52. §bSweetheart§r\\n53. §9Sage§r\\n54. §9Banshee§r\\n55. §9Professor§r\\n56. §9Choirboy§r\\n57. §9Huntsman§r\\n58. §bDamsel§r\\n59. §9Amnesiac§r\\n60. §9Farmer§r\\n61. §bTinker§r\\n62. §bMoonchild"','"§l§nOther Night Order§r\\n63. §9Grandmother§r\\n64. §9Ravenkeeper§r\\n65. §9Empath§r\\n66. §9Fortune Teller§r\\n67. §9Undertaker§r\\n68. §9Dreamer§r\\n69. §9Flowergirl§r\\n70. §9Town Crier§r\\n71. §9Oracle§r\\n72. §9Seamstress§r\\n73. §9Juggler§r\\n74. §9Balloonist"','"§l§nOther Night Order§r\\n75. §9Village Idiot§r\\n76. §9King§r\\n77. §9Bounty Hunter§r\\n78. §9Nightwatchman§r\\n79. §9Cult Leader§r\\n80. §bButler§r\\n81. §cSpy§r\\n82. §9High Priestess§r\\n83. §9General§r\\n84. §9Chambermaid§r\\n85. §9Mathematician§r\\n86. §4Leviathan"']}]
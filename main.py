@@ -1,13 +1,3 @@
-import json
-
-import pandas as pd
-
-file = 'roles.xlsx'
-all_sheets = pd.read_excel(file, sheet_name=None)
-sheets = list(all_sheets.keys())[1:]
-
-info = pd.read_excel(file, sheet_name=list(all_sheets.keys())[0])
-
 ALIGNMENT_INFO = {
     'townsfolk': {'title': 'Townsfolk', 'colour': 'dark_blue', 'text_colour': 'blue', 'team': 'Good'},
     'outsider': {'title': 'Outsider', 'colour': 'dark_aqua', 'text_colour': 'aqua', 'team': 'Good'},
@@ -18,3 +8,28 @@ ALIGNMENT_INFO = {
 }
 
 SUBSET_ALIGNMENTS = {a: ALIGNMENT_INFO[a] for a in ALIGNMENT_INFO if a in {'townsfolk', 'outsider', 'minion', 'demon'}}
+
+# The icon value range that is mapped onto each gradient when recolouring tokens.
+PALETTE_VALUE_RANGE = (0.2784313725490196, 0.40784313725490196)
+
+# The dark and light end of the colour gradient for each alignment.
+GRADIENTS = {
+    'townsfolk': ((0, 89, 183), (0, 138, 212)),
+    'outsider': ((0, 149, 183), (0, 208, 212)),
+    'minion': ((147, 15, 19), (196, 47, 49)),
+    'demon': ((114, 11, 14), (161, 17, 22)),
+    'fabled': ((166, 84, 0), (219, 186, 0)),
+}
+
+# The token texture variants. 'gradient' is either a single gradient or a (left half, right half) pair,
+# and 'blend' is the gradient and alpha divisor used for partially transparent icon pixels, if any.
+PALETTES = {
+    'townsfolk': {'gradient': 'townsfolk', 'blend': ('townsfolk', 400)},
+    'outsider': {'gradient': 'outsider', 'blend': ('outsider', 300)},
+    'minion': {'gradient': 'minion', 'blend': ('minion', 300)},
+    'demon': {'gradient': 'demon', 'blend': ('demon', 400)},
+    'fabled': {'gradient': 'fabled', 'blend': None},
+    'traveller': {'gradient': ('townsfolk', 'minion'), 'blend': ('fabled', 400)},
+    'good_traveller': {'gradient': ('townsfolk', 'fabled'), 'blend': None},
+    'evil_traveller': {'gradient': ('fabled', 'minion'), 'blend': None},
+}
@@ -0,0 +1,139 @@
+import hashlib
+import json
+from io import BytesIO
+
+TEXTURE_PATTERN = ('assets/', '/textures/', '.png')
+MODEL_PATTERN = ('assets/', '/models/', '.json')
+
+
+def matches(location, pattern):
+    """
+    Returns whether a pack location is under a namespace directory, e.g. assets/<namespace>/textures/*.png.
+    """
+    prefix, directory, suffix = pattern
+    return location.startswith(prefix) and location.endswith(suffix) and directory in location
+
+
+def texture_id(location):
+    """
+    Returns the resource location that models use for a texture in a pack,
+    e.g. 'botctokens:item/demon/imp' for 'assets/botctokens/textures/item/demon/imp.png'.
+    """
+    namespace, path = location.removeprefix('assets/').split('/textures/', 1)
+    return f'{namespace}:{path.removesuffix(".png")}'
+
+
+def encode_candidates(pixels):
+    """
+    Yields PIL images holding exactly the given RGBA pixels in each applicable PNG colour type,
+    with the transparency of palette images stored in the palette.
+    """
+    import numpy as np
+    from PIL import Image
+
+    yield Image.fromarray(pixels, 'RGBA')
+    opaque = bool((pixels[..., 3] == 255).all())
+    grey = bool((pixels[..., 0] == pixels[..., 1]).all() and (pixels[..., 1] == pixels[..., 2]).all())
+    if opaque:
+        yield Image.fromarray(np.ascontiguousarray(pixels[..., :3]), 'RGB')
+        if grey:
+            yield Image.fromarray(np.ascontiguousarray(pixels[..., 0]), 'L')
+    elif grey:
+        yield Image.fromarray(np.ascontiguousarray(pixels[..., [0, 3]]), 'LA')
+
+    colours, indices = np.unique(pixels.reshape(-1, 4), axis=0, return_inverse=True)
+    if len(colours) <= 256:
+        image = Image.fromarray(indices.reshape(pixels.shape[:2]).astype(np.uint8), 'P')
+        image.putpalette(colours[:, :3].tobytes())
+        if not opaque:
+            image.info['transparency'] = colours[:, 3].tobytes()
+        yield image
+
+
+def optimise_png(data):
+    """
+    Re-encodes a PNG in its smallest lossless form: trying every colour type that holds its pixels exactly,
+    including a palette when it has 256 colours or fewer, at the maximum compression level and
+    without metadata. Returns the original bytes if none of the encodings is smaller.
+    """
+    import numpy as np
+    from PIL import Image
+
+    pixels = np.asarray(Image.open(BytesIO(data)).convert('RGBA'))
+    best = data
+    for image in encode_candidates(pixels):
+        buffer = BytesIO()
+        image.save(buffer, 'PNG', optimize=True, compress_level=9)
+        encoded = buffer.getvalue()
+        if len(encoded) < len(best) and np.array_equal(
+                np.asarray(Image.open(BytesIO(encoded)).convert('RGBA')), pixels):
+            best = encoded
+    return best
+
+
+def replace_textures(model, aliases):
+    """
+    Points the textures of a model at their canonical copies.
+
+    :return: Whether any texture was replaced.
+    """
+    textures = model.get('textures', {})
+    replaced = False
+    for key, texture in textures.items():
+        resource = texture if ':' in texture or texture.startswith('#') else f'minecraft:{texture}'
+        if resource in aliases:
+            textures[key] = aliases[resource]
+            replaced = True
+    return replaced
+
+
+def optimise_pack(pack):
+    """
+    Deduplicates and recompresses the textures buffered in a PackWriter before it is closed.
+
+    Textures with identical pixels are stored once, at the first of their locations in sorted order,
+    and every model that uses one of the other copies is pointed at it instead. Animated textures,
+    which have a .mcmeta file of their own, are left as they are. Every remaining texture is
+    re-encoded with optimise_png.
+
+    :param pack: The PackWriter to optimise.
+    :return: The number of duplicate textures removed, the size of the textures before and after.
+    """
+    from PIL import Image
+
+    textures = sorted(location for location in pack.entries
+                      if matches(location, TEXTURE_PATTERN) and f'{location}.mcmeta' not in pack.entries)
+    before = sum(len(pack.entries[location]) for location in textures)
+
+    canonical = {}
+    aliases = {}
+    for location in textures:
+        image = Image.open(BytesIO(pack.entries[location])).convert('RGBA')
+        digest = hashlib.sha256(repr(image.size).encode() + image.tobytes()).hexdigest()
+        original = canonical.setdefault(digest, location)
+        if original != location:
+            aliases[texture_id(location)] = texture_id(original)
+            del pack.entries[location]
+
+    if aliases:
+        for location, data in pack.entries.items():
+            if matches(location, MODEL_PATTERN):
+                model = json.loads(data)
+                if replace_textures(model, aliases):
+                    text = json.dumps(model, separators=(',', ':'), ensure_ascii=False)
+                    pack.entries[location] = text.encode('utf8')
+
+    for location in canonical.values():
+        pack.entries[location] = optimise_png(pack.entries[location])
+    after = sum(len(pack.entries[location]) for location in canonical.values())
+    return len(aliases), before, after
+
+
+def report(duplicates, before, after):
+    """
+    Prints how much optimise_pack saved.
+    """
+    saved = before - after
+    print(f'Removed {duplicates} duplicate textures and saved {saved} of {before} bytes '
+          f'({saved / before if before else 0:.1%}), leaving {after} bytes of textures')
+
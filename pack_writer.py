@@ -0,0 +1,193 @@
+import json
+import os
+import zipfile
+from io import BytesIO
+
+import tracing
+
+NAMESPACE = 'botctokens'
+PACK_FORMAT = 46
+PACK_DESCRIPTION = 'Blood on the Clocktower tokens'
+
+# Where each path in the generated directory belongs inside a resource pack.
+# Paths without a mapping, such as script books, are stored at the same path in the pack root.
+PACK_LOCATIONS = {
+    'textures/': f'assets/{NAMESPACE}/textures/',
+    'models/': f'assets/{NAMESPACE}/models/',
+    'paper.json': 'assets/minecraft/items/paper.json',
+    'items/': 'assets/minecraft/items/',
+}
+
+# A fixed timestamp for zip entries, so that identical packs are byte-identical.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Marks where iter_json streams in the items of a list.
+STREAM = '\0stream\0'
+
+
+def iter_json(data, items, indent=None):
+    """
+    Encodes a JSON value in chunks, with the STREAM placeholder in it replaced by a list of items
+    that are each encoded only as they are reached. The output matches json.dumps on the full value.
+
+    :param data: The JSON value, containing STREAM exactly once as a value.
+    :param items: An iterable of the JSON values in the streamed list.
+    :param indent: The indent to pretty-print with, or None for compact output.
+    """
+    separators = (',', ':') if indent is None else (',', ': ')
+    text = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False)
+    prefix, suffix = text.split(json.dumps(STREAM, ensure_ascii=False))
+    yield prefix + '['
+
+    # The list closes at the indentation of the line the placeholder is on, and its items are one level deeper.
+    line = prefix.rsplit('\n', 1)[-1]
+    close = '' if indent is None else '\n' + ' ' * (len(line) - len(line.lstrip(' ')))
+    newline = '' if indent is None else close + ' ' * indent
+    empty = True
+    for item in items:
+        item_text = json.dumps(item, indent=indent, separators=separators, ensure_ascii=False)
+        yield ('' if empty else ',') + newline + item_text.replace('\n', newline)
+        empty = False
+    yield ('' if empty else close) + ']' + suffix
+
+
+def write_file(location, data):
+    """
+    Writes some bytes to a file, creating its directory. Files that already hold the same bytes are left untouched.
+    """
+    if os.path.isfile(location) and os.path.getsize(location) == len(data):
+        with open(location, 'rb') as f:
+            if f.read() == data:
+                return location
+    os.makedirs(os.path.dirname(location), exist_ok=True)
+    with open(location, 'wb') as f:
+        f.write(data)
+    return location
+
+
+class OutputWriter:
+    """
+    Writes generated files as loose files under a directory, using the generated directory layout.
+    Output written this way can be tracked by the build manifest, so it supports incremental builds.
+    """
+    incremental = True
+
+    def __init__(self, root='generated'):
+        self.root = root
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def location(self, path):
+        """
+        Returns where a generated path is written to.
+        """
+        return f'{self.root}/{path}'
+
+    def write_bytes(self, path, data):
+        """
+        Writes some bytes to a generated path. Files that already hold the same bytes are left untouched.
+
+        :param path: The path relative to the generated directory, e.g. 'models/demon/imp.json'.
+        :param data: The bytes to write.
+        :return: Where the bytes were written to.
+        """
+        return write_file(self.location(path), data)
+
+    def write_json(self, path, data, indent=None):
+        """
+        Writes a JSON value to a generated path, compactly unless an indent is given.
+        """
+        separators = (',', ':') if indent is None else (',', ': ')
+        text = json.dumps(data, indent=indent, separators=separators, ensure_ascii=False)
+        return self.write_bytes(path, text.encode('utf8'))
+
+    def write_json_stream(self, path, data, items, indent=None):
+        """
+        Writes a JSON value to a generated path, streaming in the items of a list as they are encoded.
+        See iter_json for how the list is placed in the value.
+        """
+        location = self.location(path)
+        os.makedirs(os.path.dirname(location), exist_ok=True)
+        with open(location, 'w', encoding='utf8') as f:
+            for chunk in iter_json(data, items, indent):
+                f.write(chunk)
+        return location
+
+    def write_image(self, path, image):
+        """
+        Writes a PIL image to a generated path as a PNG.
+        """
+        buffer = BytesIO()
+        image.save(buffer, 'PNG')
+        return self.write_bytes(path, buffer.getvalue())
+
+    def close(self):
+        """
+        Finishes writing the output.
+        """
+
+
+class PackWriter(OutputWriter):
+    """
+    Writes generated files into a resource pack with a pack.mcmeta, either as a directory
+    or, if the target ends in '.zip', as a zip file. Entries are buffered in memory until
+    the pack is closed, so that later stages can rewrite them. Zip entries are written in
+    sorted order with fixed timestamps, so rebuilding the same pack produces the same bytes.
+    """
+    incremental = False
+
+    def __init__(self, target, description=PACK_DESCRIPTION):
+        super().__init__(target)
+        self.description = description
+        self.zipped = target.endswith('.zip')
+        self.entries = {}
+
+    def location(self, path):
+        """
+        Returns the path inside the resource pack for a generated path.
+        """
+        for prefix, location in PACK_LOCATIONS.items():
+            if path.startswith(prefix):
+                return location + path.removeprefix(prefix)
+        return path
+
+    def write_bytes(self, path, data):
+        """
+        Writes some bytes to a generated path inside the resource pack.
+
+        :param path: The path relative to the generated directory, e.g. 'models/demon/imp.json'.
+        :param data: The bytes to write.
+        :return: The location of the bytes in the pack.
+        """
+        location = self.location(path)
+        self.entries[location] = data
+        return location
+
+    def write_json_stream(self, path, data, items, indent=None):
+        """
+        Writes a JSON value to a generated path inside the resource pack, streaming in the items of a list.
+        """
+        return self.write_bytes(path, ''.join(iter_json(data, items, indent)).encode('utf8'))
+
+    def close(self):
+        """
+        Writes the pack.mcmeta and every buffered entry to the pack directory or zip file.
+        """
+        mcmeta = {'pack': {'pack_format': PACK_FORMAT, 'description': self.description}}
+        self.entries['pack.mcmeta'] = json.dumps(mcmeta, indent=2).encode('utf8')
+        if not self.zipped:
+            for location, data in self.entries.items():
+                write_file(f'{self.root}/{location}', data)
+            return
+
+        with tracing.span('write pack', entries=len(self.entries)), \
+                zipfile.ZipFile(self.root, 'w', zipfile.ZIP_DEFLATED) as pack:
+            for location in sorted(self.entries):
+                info = zipfile.ZipInfo(location, ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                pack.writestr(info, self.entries[location])
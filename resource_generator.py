@@ -1,4 +1,10 @@
-import json
+import argparse
+import os
+
+from build_cache import BuildManifest, hash_data, hash_file
+from pack_writer import NAMESPACE, OutputWriter, PackWriter
+from write_model_selector import case_model, selector_model
+
 
 class Item:
     def __init__(self, name, directory=None, texture=None):
@@ -11,8 +17,27 @@ class Item:
     def __repr__(self):
         return f"Item(name={self.name}, filename={self.filename})"
 
+    @property
+    def names(self):
+        """The custom names that select this item's model, without duplicates."""
+        return list(dict.fromkeys(self.name if isinstance(self.name, list) else [self.name]))
+
+    @property
+    def model(self):
+        """The model path of this item, relative to the namespace, e.g. 'items/balls/red_ball'."""
+        return f"{self.directory}/{self.texture}"
+
     def write_model(self):
-        return NotImplemented
+        """
+        Returns the item model that shows this item's texture as a flat item.
+        """
+        return {
+            "parent": "minecraft:item/generated",
+            "textures": {
+                "layer0": f"{NAMESPACE}:{self.model}"
+            }
+        }
+
 
 resources = {
     "minecraft:snowball": [
@@ -39,4 +64,83 @@ resources = {
     ],
 }
 
-print(resources)
\ No newline at end of file
+
+def item_cases(items):
+    """
+    Groups the custom names of some items by model. Items that share a texture share one case,
+    and a name that an earlier item already uses is dropped, since only the first case would match it.
+
+    :param items: The items registered for one base item.
+    :return: A dictionary of model paths to their custom names, sorted by model, and a list of dropped names.
+    """
+    cases = {}
+    owners = {}
+    dropped = []
+    for item in items:
+        for name in item.names:
+            if owners.setdefault(name, item.model) != item.model:
+                dropped.append(name)
+            elif name not in cases.get(item.model, []):
+                cases.setdefault(item.model, []).append(name)
+    return dict(sorted(cases.items())), dropped
+
+
+def build_resources(force=False, writer=None, registry=None):
+    """
+    Writes an item definition for every base item in the registry, selecting each registered item's model
+    by custom name, along with the item models and any textures found next to this script.
+    Base items whose registered items and this generator are unchanged since the last build are skipped.
+
+    :param force: Whether to rebuild every base item, even if it is up to date.
+    :param writer: The output to write to. Defaults to loose files under generated.
+    :param registry: A dictionary of base item ids to lists of Items. Defaults to resources.
+    """
+    writer = writer or OutputWriter()
+    registry = resources if registry is None else registry
+    manifest = BuildManifest('resources', force, writer.incremental)
+    engine = hash_file(__file__)
+
+    for base_item in sorted(registry):
+        items = registry[base_item]
+        inputs = {
+            'items': hash_data([[item.names, item.model] for item in items]),
+            'textures': hash_data({item.filename: hash_file(item.filename) for item in items}),
+            'engine': engine,
+        }
+        if manifest.is_fresh(base_item, inputs):
+            continue
+
+        cases, dropped = item_cases(items)
+        for name in dropped:
+            print(f'{base_item}: {name!r} is already used by another item')
+        item_id = base_item.removeprefix('minecraft:')
+        definition = selector_model([case_model(model, names) for model, names in cases.items()],
+                                    fallback=f'minecraft:item/{item_id}')
+        outputs = [writer.write_json(f'items/{item_id}.json', definition)]
+
+        models = {item.model: item for item in items}
+        for model in sorted(models):
+            item = models[model]
+            outputs.append(writer.write_json(f'models/{model}.json', item.write_model()))
+            if os.path.isfile(item.filename):
+                with open(item.filename, 'rb') as f:
+                    outputs.append(writer.write_bytes(f'textures/{item.filename}', f.read()))
+            else:
+                print(f'{base_item}: missing texture {item.filename}')
+        manifest.record(base_item, inputs, outputs)
+        print(f'{base_item}: {len(cases)} models, {sum(len(names) for names in cases.values())} names')
+
+    for path in manifest.prune():
+        print(f'Removed {path}')
+    manifest.save()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write the item definitions and models for custom-named props.')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='rebuild every item definition, even if it is up to date')
+    parser.add_argument('--pack', metavar='PATH',
+                        help='write into a resource pack directory, or a .zip file, instead of generated')
+    args = parser.parse_args()
+    with PackWriter(args.pack) if args.pack else OutputWriter() as writer:
+        build_resources(args.force, writer)
@@ -0,0 +1,147 @@
+import json
+import os
+import pickle
+
+import tracing
+from build_cache import hash_data, hash_file
+
+ROLES_FILE = 'roles.json'
+ICONS_FILE = 'roles.xlsx'
+CACHE_FILE = 'generated/.cache/roles.pickle'
+# The cache for catalogues loaded without roles.xlsx, kept apart so that both kinds stay cached.
+ROLES_ONLY_CACHE_FILE = 'generated/.cache/roles-only.pickle'
+
+# The alignments whose (name, icon file) column pairs appear in order in the first sheet of roles.xlsx.
+ICON_COLUMNS = ('townsfolk', 'outsider', 'minion', 'demon', 'traveller')
+
+_catalogues = {}
+
+
+def group_by(roles, key):
+    """
+    Groups a list of roles into a dictionary of lists by the value of a key, keeping their order.
+    """
+    groups = {}
+    for role in roles:
+        groups.setdefault(role.get(key), []).append(role)
+    return groups
+
+
+def read_icons(file=ICONS_FILE):
+    """
+    Reads the character name and icon file pairs for each alignment from the first sheet of roles.xlsx.
+
+    :return: A dictionary of alignments to lists of (name, icon file) pairs.
+    """
+    from openpyxl import load_workbook
+
+    with tracing.span('xlsx parse', file=file):
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            # The first row is a header row, as it is for pandas.read_excel.
+            rows = list(workbook.worksheets[0].iter_rows(min_row=2, values_only=True))
+        finally:
+            workbook.close()
+
+    icons = {}
+    for n, alignment in enumerate(ICON_COLUMNS):
+        pairs = [(row[2 * n], row[2 * n + 1]) for row in rows if len(row) > 2 * n + 1]
+        icons[alignment] = [(name, icon) for name, icon in pairs if name is not None and icon is not None]
+    return icons
+
+
+class RoleCatalogue:
+    """
+    The characters from roles.json and their icons from roles.xlsx, with indexes for quick lookup.
+
+    Attributes:
+        roles (list[dict]): Every role in roles.json, in file order.
+        icons (dict[str, list[tuple[str, str]]]): The (name, icon file) pairs from roles.xlsx, by alignment.
+        by_id (dict[str, dict]): Roles by id.
+        by_team (dict[str, list[dict]]): Roles by team, in file order.
+        by_edition (dict[str, list[dict]]): Roles by edition, in file order.
+        ids (set[str]): The id of every role.
+        positions (dict[str, int]): The index of each role id in roles.json.
+        jinxes (dict[str, dict[str, str]]): The reason for each jinx, by the id of the role that lists it
+            and then the id of the role it is jinxed with.
+        night_order (dict[str, list[dict]]): The roles that act on the 'first' and 'other' nights, in waking order.
+    """
+
+    def __init__(self, roles: list[dict], icons: dict[str, list[tuple[str, str]]]):
+        self.roles = roles
+        self.icons = icons
+        self.by_id = {role['id']: role for role in roles}
+        self.by_team = group_by(roles, 'team')
+        self.by_edition = group_by(roles, 'edition')
+        self.ids = set(self.by_id)
+        self.positions = {role['id']: n for n, role in enumerate(roles)}
+        self.jinxes = {role['id']: {jinx['id']: jinx['reason'] for jinx in role['jinxes']}
+                       for role in roles if role.get('jinxes')}
+        self.night_order = {
+            night: sorted((role for role in roles
+                           if role.get(f'{night}Night') is not None and role.get(f'{night}NightReminder')),
+                          key=lambda role: role[f'{night}Night'])
+            for night in ('first', 'other')
+        }
+
+    def __repr__(self):
+        return f"RoleCatalogue(roles={len(self.roles)}, icons={sum(len(v) for v in self.icons.values())})"
+
+    def __contains__(self, role_id):
+        return role_id in self.by_id
+
+    def __getitem__(self, role_id):
+        return self.by_id[role_id]
+
+    def get_jinxes(self, ids: set[str]) -> list[tuple[dict, dict, str]]:
+        """
+        Returns every jinx between two of the given roles, as (role, jinxed role, reason),
+        ordered by the role that lists the jinx and then by the order it lists them in.
+        """
+        pairs = []
+        for role_id in sorted(ids & self.jinxes.keys(), key=self.positions.get):
+            for other_id, reason in self.jinxes[role_id].items():
+                if other_id in ids:
+                    pairs.append((self.by_id[role_id], self.by_id[other_id], reason))
+        return pairs
+
+    def get_night_order(self, night: str, ids: set[str]) -> list[dict]:
+        """
+        Returns the given roles that act on the 'first' or 'other' night, in waking order.
+        """
+        return [role for role in self.night_order[night] if role['id'] in ids]
+
+
+def load_catalogue(roles_file=ROLES_FILE, icons_file=ICONS_FILE, cache_file=None) -> RoleCatalogue:
+    """
+    Loads the role catalogue, parsing roles.json and roles.xlsx only when they have changed.
+    If icons_file is None, roles.xlsx is not read at all and the catalogue has no icons.
+
+    The parsed catalogue is pickled to a cache file keyed by the content hashes of both inputs
+    and of this module, and is kept in memory for the rest of the process.
+    """
+    cache_file = cache_file or (CACHE_FILE if icons_file else ROLES_ONLY_CACHE_FILE)
+    key = hash_data([hash_file(roles_file), icons_file and hash_file(icons_file), hash_file(__file__)])
+    if key in _catalogues:
+        return _catalogues[key]
+
+    catalogue = None
+    if os.path.exists(cache_file):
+        try:
+            with tracing.span('catalogue cache load'), open(cache_file, 'rb') as f:
+                cached_key, cached = pickle.load(f)
+            if cached_key == key:
+                catalogue = cached
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+    if catalogue is None:
+        with tracing.span('roles parse', file=roles_file), open(roles_file, 'r', encoding='utf8') as f:
+            roles = json.load(f)
+        catalogue = RoleCatalogue(roles, read_icons(icons_file) if icons_file else {})
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((key, catalogue), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    _catalogues[key] = catalogue
+    return catalogue
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+# The scripts are run from the repository root, and read their inputs relative to it.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(autouse=True)
+def repository_root(monkeypatch):
+    """
+    Runs each test from the repository root.
+    """
+    monkeypatch.chdir(ROOT)
+    return ROOT
@@ -0,0 +1,134 @@
+import os
+from colorsys import rgb_to_hsv
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import colour_tokens
+from colour_tokens import colour_icon, load_templates, recolour, to_image
+from conftest import ROOT
+
+ICONS = sorted(file for file in os.listdir(os.path.join(ROOT, 'icons')) if file.endswith('.png'))
+ALIGNMENTS = ('townsfolk', 'outsider', 'minion', 'demon', 'fabled', 'traveller', 'good_traveller', 'evil_traveller')
+
+
+def lerp_tuple(c1, c2, p):
+    return tuple(round(c1[i] + p * (c2[i] - c1[i])) for i in range(len(c1)))
+
+
+def map_colours(v, v1, v2, c1, c2):
+    p = (v - v1) / (v2 - v1)
+    return lerp_tuple(c1, c2, p)
+
+
+def reference_recolour(icon, border, base):
+    """
+    Recolours an icon one pixel at a time, exactly as colour_tokens did before it was vectorised,
+    with the colours, value range, blend strengths and traveller halves written out as they were then,
+    so that any change to the textures fails this test.
+    """
+    width, height = icon.size
+    image = icon.load()
+    rim = border.load()
+    textures = {alignment: base.copy() for alignment in ALIGNMENTS}
+    townsfolk, outsider, minion, demon, fabled, traveller, good_traveller, evil_traveller = (
+        textures[alignment].load() for alignment in ALIGNMENTS)
+    for x in range(width):
+        for y in range(height):
+            r, g, b, a = image[x, y]
+            if a == 0:
+                continue
+            if rim[x, y][3] == 255:
+                continue
+
+            h, s, v = rgb_to_hsv(r / 255, g / 255, b / 255)
+            townsfolk_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (0, 89, 183), (0, 138, 212))
+            outsider_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (0, 149, 183), (0, 208, 212))
+            minion_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (147, 15, 19), (196, 47, 49))
+            demon_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (114, 11, 14), (161, 17, 22))
+            fabled_colour = map_colours(v, 0.2784313725490196, 0.40784313725490196, (166, 84, 0), (219, 186, 0))
+            if a == 255:
+                townsfolk[x, y] = (*townsfolk_colour, 255)
+                outsider[x, y] = (*outsider_colour, 255)
+                minion[x, y] = (*minion_colour, 255)
+                demon[x, y] = (*demon_colour, 255)
+                fabled[x, y] = (*fabled_colour, 255)
+                if x < width // 2:
+                    traveller[x, y] = (*townsfolk_colour, 255)
+                    good_traveller[x, y] = (*townsfolk_colour, 255)
+                    evil_traveller[x, y] = (*fabled_colour, 255)
+                else:
+                    traveller[x, y] = (*minion_colour, 255)
+                    good_traveller[x, y] = (*fabled_colour, 255)
+                    evil_traveller[x, y] = (*minion_colour, 255)
+            else:
+                townsfolk[x, y] = lerp_tuple(townsfolk[x, y], (*townsfolk_colour, 255), a / 400)
+                outsider[x, y] = lerp_tuple(outsider[x, y], (*outsider_colour, 255), a / 300)
+                minion[x, y] = lerp_tuple(minion[x, y], (*minion_colour, 255), a / 300)
+                demon[x, y] = lerp_tuple(demon[x, y], (*demon_colour, 255), a / 400)
+                traveller[x, y] = lerp_tuple(traveller[x, y], (*fabled_colour, 255), a / 400)
+    return textures
+
+
+def reference_pngs(icon_file, root=ROOT):
+    """
+    Returns the PNG bytes that the per-pixel loop saved for an icon, by alignment.
+    """
+    icon = Image.open(icon_file).convert('RGBA')
+    border = Image.open(os.path.join(root, 'border.png')).convert('RGBA')
+    base = Image.open(os.path.join(root, 'base.png')).convert('RGBA')
+    pngs = {}
+    for alignment, texture in reference_recolour(icon, border, base).items():
+        buffer = BytesIO()
+        texture.save(buffer, 'PNG')
+        pngs[alignment] = buffer.getvalue()
+    return pngs
+
+
+def random_icons(count=8, seed=0):
+    """
+    Returns random icons with every kind of pixel: transparent, opaque and partially transparent.
+    """
+    rng = np.random.default_rng(seed)
+    icons = []
+    for _ in range(count):
+        pixels = rng.integers(0, 256, (16, 16, 4), dtype=np.uint8)
+        alpha = rng.choice([0, 255, 1], (16, 16), p=[0.25, 0.5, 0.25])
+        pixels[..., 3] = np.where(alpha == 1, pixels[..., 3], alpha)
+        icons.append(Image.fromarray(pixels, 'RGBA'))
+    return icons
+
+
+@pytest.fixture
+def templates(monkeypatch):
+    """
+    Loads the token templates that colour_icon draws onto, as a build would.
+    """
+    monkeypatch.setattr(colour_tokens, 'TEMPLATES', load_templates())
+
+
+@pytest.mark.parametrize('filename', ICONS)
+def test_colour_icon_matches_reference_pngs(templates, filename):
+    assert colour_icon(filename) == (filename, reference_pngs(f'icons/{filename}'))
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_colour_icon_matches_reference_pngs_for_random_icons(templates, tmp_path, monkeypatch, seed):
+    os.mkdir(tmp_path / 'icons')
+    random_icons(1, seed)[0].save(tmp_path / 'icons' / 'random.png')
+    monkeypatch.chdir(tmp_path)
+    assert colour_icon('random.png') == ('random.png', reference_pngs('icons/random.png'))
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_recolour_matches_reference_pixels_for_random_icons(seed):
+    icon = random_icons(1, seed)[0]
+    templates = load_templates()
+    expected = reference_recolour(icon, Image.open('border.png').convert('RGBA'),
+                                  Image.open('base.png').convert('RGBA'))
+    textures = recolour(np.asarray(icon), templates['border'], templates['base'])
+    assert textures.keys() == expected.keys()
+    for alignment, texture in textures.items():
+        assert to_image(texture).tobytes() == expected[alignment].tobytes(), alignment
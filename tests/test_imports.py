@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+HEAVY_MODULES = ('pandas', 'openpyxl', 'PIL', 'numpy')
+# Generous for a cold interpreter on a slow machine: importing main and write_book takes tens of milliseconds.
+IMPORT_BUDGET = 1.0
+
+MEASURE = '''
+import json, sys, time
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    __import__(module)
+print(json.dumps({'seconds': time.perf_counter() - start,
+                  'modules': [name for name in %r if name in sys.modules]}))
+''' % (HEAVY_MODULES,)
+
+
+def measure_import(*modules):
+    """
+    Imports some modules in a fresh interpreter, returning how long it took and which heavy modules it loaded.
+    """
+    result = subprocess.run([sys.executable, '-c', MEASURE, *modules], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_main_and_write_book_import_quickly():
+    result = measure_import('main', 'write_book')
+    assert result['seconds'] < IMPORT_BUDGET
+    assert result['modules'] == []
+
+
+@pytest.mark.parametrize('module', ['write_models', 'write_model_selector', 'resource_generator', 'colour_tokens',
+                                    'optimise_textures', 'build_pack', 'watch', 'benchmark'])
+def test_generators_import_without_heavy_modules(module):
+    assert measure_import(module)['modules'] == []
@@ -0,0 +1,84 @@
+from functools import lru_cache
+
+PAGE_WIDTH = 114
+FORMAT_CODE = '§'
+DEFAULT_GLYPH_WIDTH = 6
+
+# The advance of each glyph in the default Minecraft font, in pixels, including the 1px gap after it.
+# Glyphs that are not listed are DEFAULT_GLYPH_WIDTH wide. Bold text is 1px wider per glyph.
+GLYPH_WIDTHS = {
+    **dict.fromkeys('!\',.:;i|', 2),
+    **dict.fromkeys('`l', 3),
+    **dict.fromkeys(' "I[]t', 4),
+    **dict.fromkeys('()*<>fk{}', 5),
+    **dict.fromkeys('@~', 7),
+}
+
+COLOUR_CODES = set('0123456789abcdef')
+
+
+def glyph_advances(text: str) -> list[tuple[str, int]]:
+    """
+    Strips the § formatting codes from some text and returns the width of each remaining character,
+    taking bold into account. Colour codes and §r reset bold, as they do in Minecraft.
+    """
+    advances = []
+    bold = False
+    chars = iter(text)
+    for char in chars:
+        if char == FORMAT_CODE:
+            code = next(chars, '').lower()
+            if code == 'l':
+                bold = True
+            elif code == 'r' or code in COLOUR_CODES:
+                bold = False
+            continue
+        advances.append((char, GLYPH_WIDTHS.get(char, DEFAULT_GLYPH_WIDTH) + (1 if bold else 0)))
+    return advances
+
+
+def wrap_line(advances: list[tuple[str, int]], width: int) -> int:
+    """
+    Counts the lines that a single line of glyphs wraps onto, breaking at spaces where possible
+    and inside words that are too long to fit on a line of their own.
+    """
+    words = []
+    word, word_width, space_width = [], 0, 0
+    for char, advance in advances:
+        if char == ' ':
+            words.append((word_width, space_width, word))
+            word, word_width, space_width = [], 0, advance
+        else:
+            word.append(advance)
+            word_width += advance
+    words.append((word_width, space_width, word))
+
+    lines, line_width = 1, 0
+    for n, (word_width, space_width, word) in enumerate(words):
+        gap = space_width if n > 0 else 0
+        if line_width + gap + word_width <= width:
+            line_width += gap + word_width
+        elif word_width <= width:
+            lines += 1
+            line_width = word_width
+        else:
+            # Break a long word wherever it reaches the edge of the page.
+            line_width += gap
+            for advance in word:
+                if line_width + advance > width:
+                    lines += 1
+                    line_width = 0
+                line_width += advance
+    return lines
+
+
+@lru_cache(maxsize=4096)
+def count_lines(text: str, width: int = PAGE_WIDTH) -> int:
+    """
+    Counts the lines that some text takes up on a book page, ignoring formatting codes.
+    Each newline starts a new line, and an empty line still takes up a line.
+
+    :param text: The text, which may contain § formatting codes and newlines.
+    :param width: The width of the page in pixels.
+    """
+    return sum(wrap_line(glyph_advances(line), width) for line in text.split('\n'))
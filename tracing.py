@@ -0,0 +1,135 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# The trace events recorded in this process, or None while tracing is disabled.
+_events = None
+
+
+class Span:
+    """
+    Records a complete trace event for the time spent inside a with block.
+    """
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        if _events is not None:
+            _events.append({'name': self.name, 'ph': 'X', 'ts': self.start / 1000, 'dur': (end - self.start) / 1000,
+                            'pid': os.getpid(), 'tid': threading.get_ident(), 'args': self.args})
+
+
+class NullSpan:
+    """
+    Stands in for a Span while tracing is disabled, doing nothing.
+    """
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+def enabled():
+    """
+    Returns whether tracing is enabled in this process.
+    """
+    return _events is not None
+
+
+def init(enable):
+    """
+    Enables tracing with no events recorded yet, or disables it. Worker processes call this on start-up,
+    so that forked workers do not inherit the events that their parent has already recorded.
+    """
+    global _events
+    _events = [] if enable else None
+
+
+def span(name, **args):
+    """
+    Returns a context manager that records how long its block takes, with some arguments to show with it.
+    While tracing is disabled this is a shared object that does nothing.
+    """
+    if _events is None:
+        return NULL_SPAN
+    return Span(name, args)
+
+
+def counter(name, **values):
+    """
+    Records the current value of one or more counters, which are drawn as a graph over time.
+    """
+    if _events is not None:
+        _events.append({'name': name, 'ph': 'C', 'ts': time.perf_counter_ns() / 1000,
+                        'pid': os.getpid(), 'tid': threading.get_ident(), 'args': values})
+
+
+def take_events():
+    """
+    Returns the events recorded so far in this process and starts a new list.
+    """
+    global _events
+    events, _events = _events, ([] if _events is not None else None)
+    return events or []
+
+
+def add_events(events):
+    """
+    Adds events recorded in another process, such as a pool worker.
+    """
+    if _events is not None:
+        _events.extend(events)
+
+
+def call(function, *args):
+    """
+    Calls a function in a worker process, returning its result along with the events it recorded,
+    for the parent process to pass to add_events.
+    """
+    return function(*args), take_events()
+
+
+def save(file):
+    """
+    Writes the recorded events to a JSON file in the Chrome trace event format, as read by
+    chrome://tracing and Perfetto, with a name for each process.
+    """
+    events = sorted(_events or [], key=lambda event: event['ts'])
+    names = [{'name': 'process_name', 'ph': 'M', 'pid': pid,
+              'args': {'name': 'main' if pid == os.getpid() else f'worker {pid}'}}
+             for pid in sorted({event['pid'] for event in events})]
+    with open(file, 'w', encoding='utf8') as f:
+        json.dump({'traceEvents': names + events, 'displayTimeUnit': 'ms'}, f, separators=(',', ':'))
+
+
+@contextmanager
+def trace(file):
+    """
+    Traces the block and saves the events to a file, if a file is given. Otherwise does nothing.
+    """
+    if not file:
+        yield
+        return
+    init(True)
+    try:
+        yield
+    finally:
+        save(file)
+        init(False)
+        print(f'Wrote a trace to {file}')
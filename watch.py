@@ -0,0 +1,138 @@
+import argparse
+import os
+import time
+import traceback
+from glob import glob
+
+from colour_tokens import TEMPLATES, build_textures
+from pack_writer import OutputWriter
+from role_catalogue import ICONS_FILE, ROLES_FILE
+from write_book import book_jobs, build_books, find_scripts
+from write_model_selector import ROLE_ICONS_FILE, build_selector
+from write_models import build_models
+
+TEMPLATE_FILES = ('base.png', 'border.png')
+
+# The order that stages are rebuilt in, since models are written for the icons that textures are made from.
+STAGES = ('textures', 'models', 'selector', 'books')
+
+
+def watched_files(scripts, settings):
+    """
+    Returns every input file that the build depends on.
+    """
+    files = sorted(glob('icons/*.png'))
+    files += [*TEMPLATE_FILES, ICONS_FILE, ROLES_FILE, ROLE_ICONS_FILE, settings]
+    files += find_scripts(scripts)
+    return [file.replace(os.sep, '/') for file in files]
+
+
+def snapshot(files):
+    """
+    Returns the modification time and size of each file that exists.
+    """
+    stats = {}
+    for file in files:
+        try:
+            stat = os.stat(file)
+        except FileNotFoundError:
+            continue
+        stats[file] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+def affected_stages(file, source):
+    """
+    Returns the stages whose output depends on an input file.
+
+    :param file: The changed file.
+    :param source: Where the selector reads its roles from, 'xlsx' or 'json'.
+    """
+    if file.startswith('icons/'):
+        return {'textures', 'models', 'selector'} if source == 'json' else {'textures', 'models'}
+    if file in TEMPLATE_FILES:
+        return {'textures'}
+    if file == ICONS_FILE:
+        return {'selector'} if source == 'xlsx' else set()
+    if file == ROLE_ICONS_FILE:
+        return {'selector'} if source == 'json' else set()
+    if file == ROLES_FILE:
+        return {'selector', 'books'} if source == 'json' else {'books'}
+    return {'books'}
+
+
+def rebuild(stages, args, writer):
+    """
+    Runs the given stages in build order. Each stage only regenerates the outputs whose inputs have changed,
+    and a stage that fails is reported without stopping the others.
+    """
+    builders = {
+        'textures': lambda: build_textures(1, writer=writer),
+        'models': lambda: build_models(writer=writer),
+        'selector': lambda: build_selector(writer=writer, pretty=args.pretty, source=args.source),
+        'books': lambda: build_books(book_jobs(args.scripts, args.settings), 1, writer=writer, pretty=args.pretty,
+                                     prune=[path for path in args.scripts if os.path.isdir(path)]),
+    }
+    for stage in STAGES:
+        if stage not in stages:
+            continue
+        start = time.perf_counter()
+        try:
+            builders[stage]()
+        except Exception:
+            traceback.print_exc()
+            print(f'{stage} failed, waiting for the next change')
+            continue
+        print(f'{stage} rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms')
+
+
+def watch(args):
+    """
+    Builds everything once, then polls the inputs and rebuilds the stages that depend on each change.
+    The templates and role catalogue stay loaded between rebuilds, and are only reloaded when they change.
+    """
+    writer = OutputWriter()
+    rebuild(STAGES, args, writer)
+    previous = snapshot(watched_files(args.scripts, args.settings))
+    print(f'Watching {len(previous)} files, press Ctrl+C to stop')
+
+    while True:
+        time.sleep(args.interval)
+        current = snapshot(watched_files(args.scripts, args.settings))
+        if current == previous:
+            continue
+        # Wait for the files to stop changing, so that a half-written file is not built.
+        while True:
+            time.sleep(args.interval)
+            settled = snapshot(watched_files(args.scripts, args.settings))
+            if settled == current:
+                break
+            current = settled
+
+        changed = sorted(file for file in previous.keys() | current.keys() if previous.get(file) != current.get(file))
+        previous = current
+        print(f'Changed: {", ".join(changed)}')
+        if any(file in TEMPLATE_FILES for file in changed):
+            TEMPLATES.clear()
+        rebuild(set().union(*(affected_stages(file, args.source) for file in changed)), args, writer)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild the textures, models, selector and books as their inputs '
+                                                 'change, keeping everything loaded between builds.')
+    parser.add_argument('scripts', nargs='*', default=['scripts'],
+                        help='script files, directories of scripts or glob patterns (default: scripts)')
+    parser.add_argument('-s', '--settings', default='book_settings.json',
+                        help='a JSON file of Script arguments by script file name (default: book_settings.json)')
+    parser.add_argument('--source', choices=('xlsx', 'json'), default='xlsx',
+                        help='build the paper selector from roles.xlsx, or from every role in roles.json '
+                             '(default: xlsx)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='indent the selector and books for reading')
+    parser.add_argument('-i', '--interval', type=float, default=0.05,
+                        help='seconds between checks for changes (default: 0.05)')
+    args = parser.parse_args()
+    try:
+        watch(args)
+    except KeyboardInterrupt:
+        pass
@@ -1,10 +1,26 @@
+import argparse
 import json
-from textwrap import wrap
-
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from glob import glob
+
+import pack_writer
+import role_catalogue
+import text_metrics
+import tracing
+from build_cache import BuildManifest, hash_data, hash_file
 from main import ALIGNMENT_INFO
+from pack_writer import STREAM, OutputWriter, PackWriter
+from role_catalogue import ROLES_FILE, load_catalogue
+from text_metrics import count_lines
 
 MAX_PAGE_LINES = 14
-APPROX_PAGE_WIDTH = 23
+MAX_BOOK_PAGES = 100
+# The most characters in the JSON text of a single written book page. Writable books allow only 1024,
+# but scripts become written books.
+MAX_PAGE_LENGTH = 32767
 
 COLOURS = {
     'black': '0', 'dark_blue': '1', 'dark_green': '2', 'dark_aqua': '3', 'dark_red': '4',
@@ -29,14 +45,51 @@ def formatted_text(text, colour='black', bold=False, italic=False, underlined=Fa
 
 
 def count_approx_lines(text):
-    """Counts the approximate number of lines in a text block."""
-    return len(wrap(text, APPROX_PAGE_WIDTH, fix_sentence_endings=True))
+    """Counts the number of lines a text block takes up on a book page."""
+    return count_lines(text)
+
+
+def layout_pages(lengths: list[int], capacity: int, gap: int = 0) -> list[tuple[int, int]]:
+    """
+    Splits a list of items into consecutive pages, using as few pages as possible and then
+    spreading the spare lines as evenly as possible between them.
+    An item that is longer than a page on its own is given a page to itself.
+
+    Parameters:
+        lengths (list[int]): The number of lines each item takes up.
+        capacity (int): The number of lines available on each page.
+        gap (int): The number of lines between items on the same page.
+
+    Returns:
+        list[tuple[int, int]]: The start and end index of the items on each page.
+    """
+    # best[i] is the (page count, sum of squared spare lines) of the best layout of the first i items
+    best = [(0, 0)] + [None] * len(lengths)
+    previous = [0] * (len(lengths) + 1)
+    for end in range(1, len(lengths) + 1):
+        used = -gap
+        for start in range(end - 1, -1, -1):
+            used += lengths[start] + gap
+            if used > capacity and start < end - 1:
+                break
+            pages, cost = best[start]
+            candidate = (pages + 1, cost + max(capacity - used, 0) ** 2)
+            if best[end] is None or candidate < best[end]:
+                best[end] = candidate
+                previous[end] = start
+
+    ranges = []
+    end = len(lengths)
+    while end > 0:
+        ranges.append((previous[end], end))
+        end = previous[end]
+    return ranges[::-1]
 
 
 class Script:
     def __init__(self, script_file, colour='black', text_colour=None, included_types=None):
-        with open('roles.json', 'r', encoding='utf8') as f:
-            self.roles_data = json.load(f)
+        self.catalogue = load_catalogue(icons_file=None)
+        self.roles_data = self.catalogue.roles
         with open(script_file, 'r', encoding='utf8') as f:
             script = json.load(f)
         self.title = script[0].get('name', 'Untitled Script')
@@ -47,9 +100,12 @@ class Script:
         if included_types is None:
             self.included_types = ['townsfolk', 'outsider', 'minion', 'demon', 'traveller', 'fabled']
         self.role_ids = script[1:]
-        self.roles = [role for role in self.roles_data if role['id'] in self.role_ids and role['team'] in self.included_types]
+        script_ids = set(self.role_ids)
+        self.roles = [role for role in self.roles_data if role['id'] in script_ids and role['team'] in self.included_types]
+        self.ids = {role['id'] for role in self.roles}
         self.pages = []
         self.data = {}
+        self.warnings = []
 
     def write_script(self):
         """Generates the script content."""
@@ -60,30 +116,43 @@ class Script:
         for night in ('first', 'other'):
             self.write_night_order(night, self.get_night_order(night))
         self.data = {'author': self.author, 'pages': self.pages}
+        self.warnings = self.check_limits()
+
+    def check_limits(self) -> list[str]:
+        """
+        Checks the book against Minecraft's page count and page length limits.
+
+        Returns:
+            list[str]: A description of each limit the book exceeds.
+        """
+        warnings = []
+        if len(self.pages) > MAX_BOOK_PAGES:
+            warnings.append(f'{len(self.pages)} pages is more than the {MAX_BOOK_PAGES} page limit')
+        for n, page in enumerate(self.pages):
+            length = len(json.dumps(page, ensure_ascii=False))
+            if length > MAX_PAGE_LENGTH:
+                warnings.append(f'page {n + 1} has {length} characters of JSON text, '
+                                f'more than the {MAX_PAGE_LENGTH} limit')
+            lines = count_approx_lines(page)
+            if lines > MAX_PAGE_LINES:
+                warnings.append(f'page {n + 1} is {lines} lines long and will not fit on one page')
+        return warnings
 
     def write_section(self, header: list | str, items: list[list | str], max_breaks: int = 3, ignore_width=False) -> None:
         """
         Writes a section to the script with a header and multiple items.
+        The header is repeated at the top of each page, and the items are laid out over as few pages as possible.
         """
         header = header if isinstance(header, list) else [header]
-        page = [header]
-        page_length = sum(count_approx_lines(line) for line in header) if not ignore_width else len(header)
-        for item in items:
-            item = item if isinstance(item, list) else [item]
-            new_lines = sum(count_approx_lines(line) for line in item) if not ignore_width else len(item)
-
-            # If the item is too long to fit on the current page, write the current page and start a new one
-            if len(page) > 1 and page_length + new_lines > MAX_PAGE_LINES:
-                self.write_page(page, page_length, max_breaks=max_breaks)
-                page = [header]
-                page_length = sum(count_approx_lines(line) for line in header) if not ignore_width else len(header)
-
-            page.append(item)
-            page_length += new_lines
-
-        # If there are still items left after the loop, write the remaining page
-        if len(page) > 1:
-            self.write_page(page, page_length, max_breaks=max_breaks)
+        items = [item if isinstance(item, list) else [item] for item in items]
+        with tracing.span('measure', items=len(items)):
+            header_length = sum(count_approx_lines(line) for line in header) if not ignore_width else len(header)
+            lengths = [sum(count_approx_lines(line) for line in item) if not ignore_width else len(item)
+                       for item in items]
+        with tracing.span('pagination', items=len(items)):
+            pages = layout_pages(lengths, MAX_PAGE_LINES - header_length)
+        for start, end in pages:
+            self.write_page([header] + items[start:end], header_length + sum(lengths[start:end]), max_breaks=max_breaks)
 
     def write_page(self, content: list, page_length: int, max_breaks: int = 3):
         """
@@ -131,37 +200,23 @@ class Script:
         Parameters:
             alignments (list): A list of alignments to include in the script.
         """
-        page = []
+        blocks = []
         for alignment in alignments:
             info = ALIGNMENT_INFO[alignment]
-            characters = [r['name'] for r in self.get_roles_by_alignment(alignment)]
+            characters = [f'- {formatted_text(r["name"], colour=info["text_colour"])}'
+                          for r in self.get_roles_by_alignment(alignment)]
             title = info['title'] + (f" - {info.get('team', '')}" if info.get('team') else '')
             header = formatted_text(title, colour=info['colour'], bold=True, underlined=True)
+            # Alignments too long for one page are split, with the header repeated on each page
+            for n in range(0, len(characters), MAX_PAGE_LINES - 1):
+                blocks.append([header] + characters[n:n + MAX_PAGE_LINES - 1])
 
-            while True:
-                # Write the alignment header
-                # If there are no characters left, break the loop
-                if not characters:
-                    break
-                # If on a new page and the page will be too long, add the current page to the pages list and start a new page
-                elif len(page) <= 1 and len(page) + len(characters) + 1 > MAX_PAGE_LINES:
-                    page = [header] + [f'- {formatted_text(character, colour=info["text_colour"])}'
-                                       for character in characters[:MAX_PAGE_LINES - 1]]
-                    characters = characters[MAX_PAGE_LINES - 1:]
-                    self.pages.append('\n'.join(page))
-                    page = []
-                # If the characters don't fit on the current page, add the current page to the pages list and start a new page
-                elif len(page) + len(characters) + (0 if len(page) <= 1 else 2) > MAX_PAGE_LINES:
-                    self.pages.append('\n'.join(page))
-                    page = []
-                # Otherwise, add the characters to the current page
-                else:
-                    if len(page) > 0:
-                        page.append('')
-                    page.append(header)
-                    page += [f'- {formatted_text(character, colour=info["text_colour"])}'
-                             for character in characters]
-                    break
+        # Alignments sharing a page are separated by a blank line
+        for start, end in layout_pages([len(block) for block in blocks], MAX_PAGE_LINES, gap=1):
+            page = blocks[start]
+            for block in blocks[start + 1:end]:
+                page = page + [''] + block
+            self.pages.append('\n'.join(page))
 
     def add_character_pages(self, alignments):
         """Adds character pages to the script for each alignment."""
@@ -185,26 +240,20 @@ class Script:
         Each jinx is represented as a dictionary with 'characters' (a tuple of two roles)
         and 'reason' (the reason for the jinx).
         """
-        jinxes = []
-        for role in self.roles:
-            for jinx in role.get('jinxes', []):
-                if jinx['id'] in self.role_ids:
-                    other = next((r for r in self.roles if r['id'] == jinx['id']), None)
-                    if other:
-                        jinxes.append({'characters': (role, other), 'reason': jinx['reason']})
-        return jinxes
+        return [{'characters': (role, other), 'reason': reason}
+                for role, other, reason in self.catalogue.get_jinxes(self.ids)]
 
     def add_jinxes(self, jinxes: list[dict]) -> None:
-        """Adds a section for jinxes to the script."""
+        """Adds a section for jinxes to the script, with the two jinxed characters above the reason."""
         if not jinxes:
             return
 
         header = formatted_text('Jinxes', colour='gold', bold=True, underlined=True)
         items = [[
-                formatted_text(role['name'], colour=info['colour'], bold=True, underlined=True),
-                formatted_text(header, colour=info['text_colour']),
-                role.get('ability', 'No ability')
-            ] for role in roles]
+                ' & '.join(formatted_text(role['name'], colour=ALIGNMENT_INFO[role['team']]['colour'], bold=True)
+                           for role in jinx['characters']),
+                jinx['reason']
+            ] for jinx in jinxes]
         self.write_section(header, items)
 
     def get_night_order(self, night: str) -> list[dict]:
@@ -216,8 +265,7 @@ class Script:
         """
         if night not in ('first', 'other'):
             raise ValueError("Night must be either 'first' or 'other'.")
-        order = [r for r in self.roles if r.get(f'{night}Night') is not None and r.get(f'{night}NightReminder')]
-        return sorted(order, key=lambda r: r.get(f'{night}Night'))
+        return self.catalogue.get_night_order(night, self.ids)
 
     def write_night_order(self, night: str, order: list = None) -> None:
         """
@@ -235,20 +283,181 @@ class Script:
                  for n, role in enumerate(order)]
         self.write_section(header, items, max_breaks=1, ignore_width=True)
 
-    def save(self, file=None) -> None:
-        """ Saves the script data to a JSON file."""
-        if not self.data:
-            raise ValueError("No script data to save. Please call write_script() first.")
-        with open(file or f'generated/scripts/{self.title.replace(" ", "_")}.json', 'w', encoding='utf8') as f:
-            json.dump(self.data, f, indent=4, ensure_ascii=False)
-
+    @property
+    def output_file(self) -> str:
+        """The default path of the saved book, relative to the writer's output."""
+        return f'scripts/{self.title.replace(" ", "_")}.json'
 
-character_types = ['townsfolk', 'outsider', 'minion', 'demon', 'fabled']
+    def save(self, file=None, writer=None, pretty=False) -> str:
+        """
+        Saves the script data to a JSON file, returning where it was written.
 
-script = Script('scripts/trouble_brewing.json', 'dark_red', 'red', character_types)
-script = Script('scripts/sects_and_violets.json', 'dark_purple', 'light_purple', character_types)
-# script = Script('scripts/bad_moon_rising.json', 'gold', 'gold', character_types)
-# script = Script('scripts/separation_church_state.json', 'dark_purple', 'light_purple')
-# script = Script('scripts/whalebucket.json', included_types=character_types)
-script.write_script()
-script.save()
+        Parameters:
+            file (str): The path to save to, relative to the writer's output. Defaults to scripts/<title>.json.
+            writer (OutputWriter): The output to write to. Defaults to loose files under generated.
+            pretty (bool): Whether to indent the output for reading, rather than writing it compactly.
+        """
+        if not self.data:
+            raise ValueError("No script data to save. Please call write_script() first.")
+        return save_book(writer or OutputWriter(), file or self.output_file, self.data, pretty)
+
+
+def save_book(writer, file: str, data: dict, pretty=False) -> str:
+    """
+    Writes book data to a JSON file, streaming the pages out one at a time, and returns where it was written.
+    """
+    with tracing.span('json dump', file=file):
+        return writer.write_json_stream(file, {**data, 'pages': STREAM}, data['pages'], indent=4 if pretty else None)
+
+
+def find_scripts(paths: list[str]) -> list[str]:
+    """
+    Expands a list of script files, directories and glob patterns into a sorted list of script files.
+    """
+    files = set()
+    for path in paths:
+        files.update(glob(os.path.join(path, '*.json')) if os.path.isdir(path) else glob(path))
+    return sorted(files)
+
+
+def book_jobs(scripts: list[str], settings: str) -> list[dict]:
+    """
+    Returns a job for each script found in some paths, with its Script arguments from a settings file, if it exists.
+    """
+    options = {}
+    if os.path.exists(settings):
+        with open(settings, 'r', encoding='utf8') as f:
+            options = json.load(f)
+    return [{'script': file, **options.get(os.path.basename(file), {})} for file in find_scripts(scripts)]
+
+
+def render_script(script, colour='black', text_colour=None, included_types=None) -> tuple[str, dict, list, float]:
+    """
+    Writes the book for a script without saving it.
+
+    Returns:
+        tuple: The book's default save path, the book data, any limits it exceeds and the number of seconds taken.
+    """
+    start = time.perf_counter()
+    with tracing.span('render', script=script):
+        book = Script(script, colour, text_colour, included_types)
+        book.write_script()
+    tracing.counter('pages', pages=len(book.pages))
+    return book.output_file, book.data, book.warnings, time.perf_counter() - start
+
+
+def init_worker(trace=False) -> None:
+    """
+    Loads the role catalogue once per worker process, and enables tracing in it if the parent is tracing.
+    """
+    tracing.init(trace)
+    load_catalogue(icons_file=None)
+
+
+def try_render_script(job: dict) -> tuple[tuple | None, str | None]:
+    """
+    Renders a script job, returning any error rather than raising it, so that one bad script does not stop a batch.
+    """
+    try:
+        return render_script(**job), None
+    except Exception as e:
+        return None, repr(e)
+
+
+def build_books(jobs: list[dict], workers: int = None, force=False, writer=None, pretty=False,
+                prune: list[str] = None) -> None:
+    """
+    Writes and saves the books for many scripts, rendering them concurrently across a pool of worker processes.
+    Scripts whose file, roles.json, colour settings and this generator are unchanged since the last build are skipped.
+
+    Parameters:
+        jobs (list[dict]): The scripts to build, each with a 'script' path and optionally the 'colour',
+            'text_colour' and 'included_types' arguments of Script.
+        workers (int): The number of worker processes to use. Defaults to the number of CPUs,
+            and 1 renders everything in the current process.
+        force (bool): Whether to rebuild every book, even if it is up to date.
+        writer (OutputWriter): The output to write to. Defaults to loose files under generated.
+        pretty (bool): Whether to indent the books for reading, rather than writing them compactly.
+        prune (list[str]): Directories of scripts whose books are deleted if their script is not among the jobs.
+    """
+    writer = writer or OutputWriter()
+    manifest = BuildManifest('scripts', force, writer.incremental)
+    engine = [hash_file(module) for module in (__file__, role_catalogue.__file__, pack_writer.__file__,
+                                          text_metrics.__file__)]
+    roles = hash_file(ROLES_FILE)
+    alignments = hash_data(ALIGNMENT_INFO)
+    inputs = {job['script']: {
+        'script': hash_file(job['script']),
+        'roles': roles,
+        'alignments': alignments,
+        'settings': hash_data({k: v for k, v in job.items() if k != 'script'}),
+        'engine': engine,
+        'pretty': pretty,
+    } for job in jobs}
+    stale = [job for job in jobs if not manifest.is_fresh(job['script'], inputs[job['script']])]
+
+    start = time.perf_counter()
+    # Load the catalogue before starting the pool, so that forked workers share it.
+    load_catalogue(icons_file=None)
+    if workers == 1 or len(stale) <= 1:
+        results = list(map(try_render_script, stale))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(tracing.enabled(),)) as pool:
+            results = []
+            for result, events in pool.map(partial(tracing.call, try_render_script), stale):
+                results.append(result)
+                tracing.add_events(events)
+
+    failures = 0
+    for job, (result, error) in zip(stale, results):
+        if error:
+            failures += 1
+            print(f'{"failed":>10}  {job["script"]}: {error}')
+            continue
+        file, data, warnings, seconds = result
+        manifest.record(job['script'], inputs[job['script']], [save_book(writer, file, data, pretty)])
+        print(f'{seconds * 1000:7.1f} ms  {job["script"]}')
+        for warning in warnings:
+            print(f'{"warning":>10}  {job["script"]}: {warning}')
+    if prune:
+        for path in manifest.prune(prune):
+            print(f'Removed {path}')
+    manifest.save()
+
+    print(f'{len(stale) - failures} built, {len(jobs) - len(stale)} up to date, {failures} failed '
+          f'in {time.perf_counter() - start:.2f} s')
+
+
+def build_script(script_file, colour='black', text_colour=None, included_types=None, force=False, writer=None,
+                 pretty=False):
+    """
+    Writes and saves the book for a script, unless the script, roles.json, the colour settings
+    and this generator are unchanged since the last build.
+    """
+    job = {'script': script_file, 'colour': colour, 'text_colour': text_colour, 'included_types': included_types}
+    build_books([job], workers=1, force=force, writer=writer, pretty=pretty)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write Minecraft books for Blood on the Clocktower scripts.')
+    parser.add_argument('scripts', nargs='*', default=['scripts'],
+                        help='script files, directories of scripts or glob patterns (default: scripts)')
+    parser.add_argument('-s', '--settings', default='book_settings.json',
+                        help='a JSON file of Script arguments by script file name (default: book_settings.json)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='number of worker processes (default: one per CPU)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='rebuild every book, even if it is up to date')
+    parser.add_argument('--pack', metavar='PATH',
+                        help='write into a resource pack directory, or a .zip file, instead of generated')
+    parser.add_argument('--pretty', action='store_true',
+                        help='indent the books for reading')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record where the build spends its time to a Chrome trace event JSON file')
+    args = parser.parse_args()
+
+    jobs = book_jobs(args.scripts, args.settings)
+    # Books are only removed for scripts deleted from a directory that was built in full.
+    directories = [path for path in args.scripts if os.path.isdir(path)]
+    with tracing.trace(args.trace), PackWriter(args.pack) if args.pack else OutputWriter() as writer:
+        build_books(jobs, args.workers, args.force, writer, args.pretty, directories)
@@ -1,31 +1,50 @@
+import argparse
 import json
+import os
 
-import pandas as pd
-
+import pack_writer
+import role_catalogue
+from build_cache import BuildManifest, hash_data, hash_file
 from main import ALIGNMENT_INFO, SUBSET_ALIGNMENTS
+import tracing
+from pack_writer import STREAM, OutputWriter
+from role_catalogue import ROLES_FILE, load_catalogue
 
 file = 'roles.xlsx'
-all_sheets = pd.read_excel(file, sheet_name=None)
-sheets = list(all_sheets.keys())[1:]
-info = pd.read_excel(file, sheet_name=list(all_sheets.keys())[0])
-
-data = {
-    "model": {
-        "type": "minecraft:select",
-        "property": "minecraft:component",
-        "component": "minecraft:custom_name",
-        "cases": [],
-        "fallback": {
-            "type": "minecraft:model",
-            "model": "minecraft:item/paper"
+output_file = 'paper.json'
+
+# The icon file for each role id, for building the selector from roles.json without roles.xlsx.
+ROLE_ICONS_FILE = 'role_icons.json'
+# The icon used for roles that have no entry in role_icons.json.
+DEFAULT_ICON = 'circle'
+
+REGEX_PREFIX = 'iregex:'
+REGEX_SPECIAL = set('\\^$.|?*+()[]{}')
+
+
+def selector_model(cases, fallback='minecraft:item/paper'):
+    """
+    Returns an item definition that selects a model by the item's custom name.
+    :param cases: The list of cases, or STREAM to stream them in when writing.
+    :param fallback: The model to show when no case matches, which defaults to plain paper.
+    """
+    return {
+        "model": {
+            "type": "minecraft:select",
+            "property": "minecraft:component",
+            "component": "minecraft:custom_name",
+            "cases": cases,
+            "fallback": {
+                "type": "minecraft:model",
+                "model": fallback
+            }
         }
     }
-}
 
 
-def write_character(name, file, alignment):
+def write_character(name, file, alignment, alignments=SUBSET_ALIGNMENTS):
     character_cases = {}
-    for al in SUBSET_ALIGNMENTS:
+    for al in alignments:
         character_cases[f'{al}/{file}'] = character_cases.get(f'{al}/{name}', []) + [
             {'italic': False,
              'extra': [{'color': ALIGNMENT_INFO[al]['text_colour'],
@@ -34,45 +53,260 @@ def write_character(name, file, alignment):
              'text': ''}]
     character_cases[f'{alignment}/{file}'] = character_cases.get(f'{alignment}/{name}', []) + [
         name,
-        f'iregex:.*{name}.*',
+        f'{REGEX_PREFIX}.*{name}.*',
     ]
 
     return character_cases
 
 
-def write_alignment(alignment, column1, column2):
+def write_alignment(alignment, icons):
     """
-    Writes the model cases for a given alignment based on the specified columns in the info DataFrame.
+    Writes the model cases for a given alignment from its character names and icon file names.
     :param alignment: The alignment to write cases for (e.g., 'townsfolk', 'outsider').
-    :param column1: The index of the first column in the info DataFrame to use for names.
-    :param column2: The index of the second column in the info DataFrame to use for file names.
+    :param icons: A list of (character name, icon file name) pairs for the alignment.
     :return: A dictionary containing the alignment cases with character names and their corresponding file names.
     """
     alignment_cases = {}
-    for row in zip(info.iloc[:, column1], info.iloc[:, column2]):
-        if pd.isnull(row[0]) or pd.isnull(row[1]):
-            continue
+    for row in icons:
         for k, v in write_character(*row, alignment).items():
             alignment_cases[k] = alignment_cases.get(k, []) + v
     return alignment_cases
 
 
-cases = {}
-for n, alignment in enumerate(SUBSET_ALIGNMENTS.keys()):
-    alignment_cases = write_alignment(alignment, 2 * n, 2 * n + 1)
-    for k, v in alignment_cases.items():
-        cases[k] = cases.get(k, []) + v
+def write_roles(roles, role_icons, available=None):
+    """
+    Writes the model cases for every role in one pass, selectable by name in the colour of any alignment.
+    :param roles: The roles to write cases for, as in roles.json.
+    :param role_icons: A dictionary of role ids to icon file names.
+    :param available: The icon file names that have models, if only some do.
+    :return: The dictionary of cases, the ids of the roles with no icon, and the ids of the roles whose icon
+        has no model, all of which fall back to DEFAULT_ICON.
+    """
+    cases = {}
+    missing = []
+    unavailable = []
+    for role in roles:
+        icon = role_icons.get(role['id'])
+        if icon is None:
+            missing.append(role['id'])
+            icon = DEFAULT_ICON
+        elif available is not None and icon not in available:
+            unavailable.append(f'{role["id"]} ({icon})')
+            icon = DEFAULT_ICON
+        for k, v in write_character(role['name'], icon, role['team'], ALIGNMENT_INFO).items():
+            cases[k] = cases.get(k, []) + v
+    return cases, missing, unavailable
+
+
+def available_icons(directory='icons'):
+    """
+    Returns the names of the icons that build_models writes models for.
+    """
+    return {f.removesuffix('.png') for f in os.listdir(directory) if f.endswith('.png')}
+
+
+def read_role_icons(icons_file=ROLE_ICONS_FILE):
+    """
+    Reads the icon file name for each role id from role_icons.json.
+    """
+    with open(icons_file, 'r', encoding='utf8') as f:
+        return json.load(f)
+
+
+def export_role_icons(icons_file=ROLE_ICONS_FILE):
+    """
+    Rewrites role_icons.json from the (name, icon file) pairs in roles.xlsx, keeping the icons
+    of roles that roles.xlsx does not list. Roles are written in roles.json order.
+    """
+    catalogue = load_catalogue(icons_file=file)
+    ids = {role['name']: role['id'] for role in catalogue.roles}
+    role_icons = read_role_icons(icons_file) if os.path.exists(icons_file) else {}
+    for pairs in catalogue.icons.values():
+        for name, icon in pairs:
+            if name in ids:
+                role_icons[ids[name]] = icon
+            else:
+                print(f'{name} is not in {ROLES_FILE}')
+    order = sorted(role_icons, key=lambda role_id: catalogue.positions.get(role_id, len(catalogue.roles)))
+    role_icons = {role_id: role_icons[role_id] for role_id in order}
+    with open(icons_file, 'w', encoding='utf8') as f:
+        json.dump(role_icons, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print(f'Wrote {len(role_icons)} icons to {icons_file}')
+
+
+def escape_regex(text):
+    """
+    Escapes the characters in some text that are special in a regular expression.
+    """
+    return ''.join('\\' + char if char in REGEX_SPECIAL else char for char in text)
+
+
+def trie_regex(words):
+    """
+    Returns a regular expression that matches any of the given words, as an alternation
+    with the common prefixes of the words factored out, e.g. 'sca(?:pegoat|rlet woman)'.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        alternatives = [escape_regex(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and '' not in node:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')' + ('?' if '' in node else '')
+
+    return build(trie)
+
+
+def optimise_cases(cases):
+    """
+    Reduces selector cases to as few conditions and regular expressions as possible, for cheaper matching on the client.
+
+    Exact-match conditions are deduplicated, dropping any that an earlier case already matches, and are all
+    tested before any regular expression. Each '.*name.*' expression is reduced to its case-insensitive name;
+    names containing another name of the same model are dropped, since that name already matches them,
+    and the rest are merged into one anchored alternation per model. Names containing a name of another
+    model are tested in an earlier case, so that the longer name still wins.
+
+    :param cases: A dictionary of model names to lists of conditions.
+    :return: The list of (model, conditions) cases, in the order to test them, and statistics about the reduction.
+    """
+    exact_cases = {}
+    seen = set()
+    contains = {}
+    for model, conditions in cases.items():
+        for condition in conditions:
+            if isinstance(condition, str) and condition.startswith(REGEX_PREFIX):
+                name = condition.removeprefix(f'{REGEX_PREFIX}.*').removesuffix('.*').lower()
+                contains.setdefault(name, model)
+                continue
+            key = json.dumps(condition, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                exact_cases.setdefault(model, []).append(condition)
+
+    names = {model: [] for model in cases}
+    for name, model in contains.items():
+        if not any(other != name and other in name for other in contains if contains[other] == model):
+            names[model].append(name)
+
+    # A name must be tested before any name of another model that it contains.
+    levels = {}
+    for name in sorted(set().union(*names.values()), key=len, reverse=True):
+        longer = [levels[other] for other in levels if name in other and contains[other] != contains[name]]
+        levels[name] = max(longer, default=-1) + 1
+
+    regex_cases = []
+    for level in range(max(levels.values(), default=-1) + 1):
+        for model, model_names in names.items():
+            level_names = [name for name in model_names if levels[name] == level]
+            if level_names:
+                regex_cases.append((model, [f'{REGEX_PREFIX}^.*{trie_regex(level_names)}.*$']))
 
-for k, v in cases.items():
-    print(k, v)
-    data['model']['cases'].append({
-        "when": v,
+    optimised = list(exact_cases.items()) + regex_cases
+    stats = {
+        'cases': (len(cases), len(optimised)),
+        'conditions': (sum(len(v) for v in cases.values()), sum(len(v) for _, v in optimised)),
+        'regexes': (sum(1 for v in cases.values() for c in v if isinstance(c, str) and c.startswith(REGEX_PREFIX)),
+                    len(regex_cases)),
+    }
+    return optimised, stats
+
+
+def case_model(model, when):
+    """
+    Returns a selector case that shows a token model when any of the conditions match.
+    """
+    return {
+        "when": when,
         "model": {
             "type": "minecraft:model",
-            "model": f"botctokens:{k}"
+            "model": f"botctokens:{model}"
         }
+    }
+
+
+def build_selector(force=False, writer=None, pretty=False, source='xlsx'):
+    """
+    Writes the paper selector model, unless its source files and this generator are unchanged since the last build.
+    The cases are streamed out as they are encoded, compactly unless pretty is set.
+    :param force: Whether to rebuild the selector even if it is up to date.
+    :param writer: The output to write the selector to. Defaults to loose files under generated.
+    :param pretty: Whether to indent the output for reading.
+    :param source: 'xlsx' to select the four main alignments from roles.xlsx, or 'json' to select
+        every role in roles.json, in all six alignments, with its icon from role_icons.json.
+    """
+    writer = writer or OutputWriter()
+    manifest = BuildManifest('selector', force, writer.incremental)
+    if source == 'json':
+        available = available_icons()
+        inputs = {'roles': hash_file(ROLES_FILE), 'icons': hash_file(ROLE_ICONS_FILE),
+                  'available': hash_data(sorted(available))}
+    else:
+        inputs = {'roles': hash_file(file)}
+    inputs.update({
+        'source': source,
+        'alignments': hash_data(ALIGNMENT_INFO),
+        'engine': [hash_file(module) for module in (__file__, role_catalogue.__file__, pack_writer.__file__)],
+        'pretty': pretty,
     })
-with open('generated/paper.json', 'w') as f:
-    # f.write(json.dumps(data, indent=0, separators=(',',':')).replace('"{', "{").replace('}"', "}")
-    #                                       .replace('\\"', '"').replace('\n', ''))
-    json.dump(data, f, indent=2, separators=(',', ':'))
+    if manifest.is_fresh('paper', inputs):
+        print(f'{writer.location(output_file)} is up to date')
+        return
+
+    if source == 'json':
+        catalogue = load_catalogue(icons_file=None)
+        with tracing.span('selector cases', source=source):
+            cases, missing, unavailable = write_roles(catalogue.roles, read_role_icons(), available)
+        if missing:
+            print(f'No icon in {ROLE_ICONS_FILE} for {", ".join(missing)}; using {DEFAULT_ICON}')
+        if unavailable:
+            print(f'No icon in icons/ for {", ".join(unavailable)}; using {DEFAULT_ICON}')
+    else:
+        catalogue = load_catalogue(icons_file=file)
+        with tracing.span('selector cases', source=source):
+            cases = {}
+            for alignment in SUBSET_ALIGNMENTS:
+                alignment_cases = write_alignment(alignment, catalogue.icons[alignment])
+                for k, v in alignment_cases.items():
+                    cases[k] = cases.get(k, []) + v
+
+    with tracing.span('optimise cases'):
+        optimised, stats = optimise_cases(cases)
+    tracing.counter('selector', cases=len(optimised), conditions=stats['conditions'][1])
+    items = (case_model(k, v) for k, v in optimised)
+    with tracing.span('json dump', file=output_file):
+        location = writer.write_json_stream(output_file, selector_model(STREAM), items, indent=2 if pretty else None)
+    manifest.record('paper', inputs, [location])
+    manifest.save()
+    print(f'Wrote {location}')
+    for name, (before, after) in stats.items():
+        print(f'{name:>12}: {before} -> {after}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write the paper item definition that selects token models by name.')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='rebuild the selector, even if it is up to date')
+    parser.add_argument('--pretty', action='store_true',
+                        help='indent the output for reading')
+    parser.add_argument('--source', choices=('xlsx', 'json'), default='xlsx',
+                        help='read the four main alignments from roles.xlsx, or every role from roles.json '
+                             f'with icons from {ROLE_ICONS_FILE} (default: xlsx)')
+    parser.add_argument('--export-icons', action='store_true',
+                        help=f'update {ROLE_ICONS_FILE} from roles.xlsx and exit')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record where the build spends its time to a Chrome trace event JSON file')
+    args = parser.parse_args()
+    if args.export_icons:
+        export_role_icons()
+    else:
+        with tracing.trace(args.trace), OutputWriter() as writer:
+            build_selector(args.force, writer, args.pretty, args.source)
@@ -1,59 +1,66 @@
-import json
+import argparse
 import os
-from main import ALIGNMENT_INFO
-
-for filename in os.listdir('icons'):
-    if not filename.endswith('.png'):
-        continue
-    print(filename)
-
-    with open(f'generated/models/townsfolk/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/townsfolk/{filename.removesuffix('.png')}"
-            }
-        }
-        f.write(json.dumps(data, indent=2))
-    with open(f'generated/models/outsider/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/outsider/{filename.removesuffix('.png')}"
-            }
-        }
-        f.write(json.dumps(data, indent=2))
-    with open(f'generated/models/minion/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/minion/{filename.removesuffix('.png')}"
-            }
-        }
-        f.write(json.dumps(data, indent=2))
-    with open(f'generated/models/demon/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/demon/{filename.removesuffix('.png')}"
-            }
-        }
-        f.write(json.dumps(data, indent=2))
-    with open(f'generated/models/traveller/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/traveller/{filename.removesuffix('.png')}"
-            }
-        }
-        f.write(json.dumps(data, indent=2))
-    with open(f'generated/models/fabled/{filename.removesuffix(".png")}.json', 'w') as f:
-        data = {
-            "parent": "minecraft:item/generated",
-            "textures": {
-                "layer0": f"botctokens:item/fabled/{filename.removesuffix('.png')}"
-            }
+
+import tracing
+from build_cache import BuildManifest, hash_data, hash_file
+from main import ALIGNMENT_INFO, PALETTES
+from pack_writer import OutputWriter
+
+
+def model_variants():
+    """
+    Returns the alignments to write models for: every alignment, plus the split texture variants
+    (such as good and evil travellers) that colour_tokens.py generates.
+    """
+    return list(ALIGNMENT_INFO) + [name for name in PALETTES if name not in ALIGNMENT_INFO]
+
+
+def item_model(variant, icon):
+    """
+    Returns the item model for an icon recoloured for an alignment.
+    """
+    return {
+        "parent": "minecraft:item/generated",
+        "textures": {
+            "layer0": f"botctokens:item/{variant}/{icon}"
         }
-        f.write(json.dumps(data, indent=2))
+    }
+
+
+def build_models(force=False, writer=None):
+    """
+    Writes an item model for every icon and alignment.
+    :param force: Whether to rebuild every model, even if it is up to date.
+    :param writer: The output to write the models to. Defaults to loose files under generated.
+    """
+    writer = writer or OutputWriter()
+    manifest = BuildManifest('models', force, writer.incremental)
+    variants = model_variants()
+    inputs = {'variants': hash_data(variants), 'engine': hash_file(__file__)}
+
+    filenames = sorted(f for f in os.listdir('icons') if f.endswith('.png'))
+    stale = [f for f in filenames if not manifest.is_fresh(f, inputs)]
+    models = {filename: {f'models/{variant}/{filename.removesuffix(".png")}.json':
+                         item_model(variant, filename.removesuffix('.png'))
+                         for variant in variants}
+              for filename in stale}
+
+    tracing.counter('models', stale=len(stale), fresh=len(filenames) - len(stale))
+    for filename, icon_models in models.items():
+        print(filename)
+        with tracing.span('write models', icon=filename):
+            outputs = [writer.write_json(path, data) for path, data in icon_models.items()]
+        manifest.record(filename, inputs, outputs)
+
+    for path in manifest.prune():
+        print(f'Removed {path}')
+    manifest.save()
 
 
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write an item model for every token icon and alignment.')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='record where the build spends its time to a Chrome trace event JSON file')
+    args = parser.parse_args()
+    with tracing.trace(args.trace), OutputWriter() as writer:
+        build_models(writer=writer)